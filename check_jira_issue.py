@@ -1,41 +1,73 @@
 #!/usr/bin/env python3
 """Check JIRA issue details"""
 import os
+import sys
+from typing import List
+
 from jira import JIRA
+from jira.resources import Issue
 from dotenv import load_dotenv
 
-load_dotenv()
-
-base_url = os.getenv("JIRA_BASE_URL")
-username = os.getenv("JIRA_USERNAME")
-token = os.getenv("JIRA_TOKEN")
-
-jira = JIRA(server=base_url, auth=(username, token))
-
-# Check the latest issue
-issue_key = "KAN-12"
-issue = jira.issue(issue_key)
-
-print(f"\n{'='*80}")
-print(f"JIRA Issue: {issue.key}")
-print(f"{'='*80}")
-print(f"Summary: {issue.fields.summary}")
-print(f"Status: {issue.fields.status.name}")
-print(f"\nComments ({len(issue.fields.comment.comments)} total):")
-print("-" * 80)
-
-for i, comment in enumerate(issue.fields.comment.comments, 1):
-    print(f"\n[Comment {i}] {comment.author.displayName} - {comment.created[:10]}")
-    print(f"{comment.body}")
-    print("-" * 80)
-
-print(f"\nActivity Log:")
-print("-" * 80)
-# Get change history
-for history in issue.changelog.histories:
-    print(f"\n{history.created[:19]}: {history.author.displayName}")
-    for item in history.items:
-        if item.field == "status":
-            print(f"  Status changed: {item.fromString} → {item.toString}")
-        elif item.field == "Comment":
-            print(f"  Comment added")
+
+def dump_issues(jira: JIRA, keys: List[str]):
+    """Print summary, comments and activity log for each issue in keys"""
+    # One JQL search fetches every issue (paged by the client) instead of a
+    # jira.issue() round-trip per key; the changelog is expanded inline.
+    # search_issues() always loads the /field catalog to translate field
+    # names, so page through the search endpoint directly instead.
+    jql = "key in ({})".format(", ".join(f'"{key}"' for key in keys))
+    issues = jira._fetch_pages(
+        Issue,
+        "issues",
+        "search",
+        maxResults=False,
+        params={
+            "jql": jql,
+            "fields": ["summary", "status", "comment"],
+            "expand": "changelog",
+            "validateQuery": False,
+        },
+        use_post=True,
+    )
+
+    for issue in issues:
+        print(f"\n{'='*80}")
+        print(f"JIRA Issue: {issue.key}")
+        print(f"{'='*80}")
+        print(f"Summary: {issue.fields.summary}")
+        print(f"Status: {issue.fields.status.name}")
+        print(f"\nComments ({len(issue.fields.comment.comments)} total):")
+        print("-" * 80)
+
+        for i, comment in enumerate(issue.fields.comment.comments, 1):
+            print(f"\n[Comment {i}] {comment.author.displayName} - {comment.created[:10]}")
+            print(f"{comment.body}")
+            print("-" * 80)
+
+        print(f"\nActivity Log:")
+        print("-" * 80)
+        # Get change history
+        for history in issue.changelog.histories:
+            print(f"\n{history.created[:19]}: {history.author.displayName}")
+            for item in history.items:
+                if item.field == "status":
+                    print(f"  Status changed: {item.fromString} → {item.toString}")
+                elif item.field == "Comment":
+                    print(f"  Comment added")
+
+
+def main():
+    load_dotenv()
+
+    base_url = os.getenv("JIRA_BASE_URL")
+    username = os.getenv("JIRA_USERNAME")
+    token = os.getenv("JIRA_TOKEN")
+
+    jira = JIRA(server=base_url, basic_auth=(username, token), get_server_info=False)
+
+    # Issue keys can be passed on the command line; defaults to the latest issue
+    dump_issues(jira, sys.argv[1:] or ["KAN-12"])
+
+
+if __name__ == "__main__":
+    main()
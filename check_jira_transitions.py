@@ -4,14 +4,61 @@ Check what transitions are available in your JIRA project.
 This helps you customize the status mapping correctly.
 """
 import os
-from dotenv import load_dotenv
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
+# JIRA client class, imported on first use so the script starts quickly
+_jira_class = None
+
+# Keywords matched when no transition is named after a status; the earliest
+# matching transition wins
+FALLBACK_KEYWORDS = {
+    "investigating": ("progress",),
+    "identified": ("todo", "backlog"),
+    "resolving": ("review", "progress"),
+    "resolved": ("done", "closed"),
+    "closed": ("done", "closed")
+}
+FALLBACK_KEYWORDS_ALL = {keyword for keywords in FALLBACK_KEYWORDS.values() for keyword in keywords}
+
+# Keys of test issues created during the run; deleted together at the end
+_cleanup = []
+
+def _delete_test_issue(jira, issue_key):
+    """Delete one test issue, reporting instead of raising on failure"""
+    try:
+        jira.delete_issue(issue_key)
+        print(f"✅ Test issue {issue_key} deleted")
+    except Exception:
+        print(f"⚠️  Could not delete test issue. You can delete {issue_key} manually.")
+
+def cleanup_test_issues(jira):
+    """Delete every test issue created during the run"""
+    if not _cleanup:
+        return
+    keys = list(_cleanup)
+    _cleanup.clear()
+    print(f"ℹ️  Cleaning up test issue(s) {', '.join(keys)}...")
+    # JIRA has no bulk-delete endpoint, so several deletions run concurrently
+    if len(keys) == 1:
+        _delete_test_issue(jira, keys[0])
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(keys), 8)) as executor:
+            list(executor.map(lambda key: _delete_test_issue(jira, key), keys))
+    print()
+
+def _get_jira_class():
+    """Import the JIRA client class once and reuse it afterwards"""
+    global _jira_class
+    if _jira_class is None:
+        from jira import JIRA
+        _jira_class = JIRA
+    return _jira_class
 
 def get_jira_client():
     """Get JIRA client with current config"""
     try:
-        from jira import JIRA
+        JIRA = _get_jira_class()
         
         base_url = os.getenv("JIRA_BASE_URL")
         username = os.getenv("JIRA_USERNAME")
@@ -22,7 +69,8 @@ def get_jira_client():
             return None
         
         jira_opts = {"server": base_url}
-        client = JIRA(options=jira_opts, basic_auth=(username, token))
+        # Skip the serverInfo request; nothing here depends on the server version
+        client = JIRA(options=jira_opts, basic_auth=(username, token), get_server_info=False)
         return client
     except Exception as e:
         print(f"❌ Failed to connect to JIRA: {e}")
@@ -30,6 +78,9 @@ def get_jira_client():
 
 def check_transitions():
     """Check available transitions in JIRA"""
+    from dotenv import load_dotenv
+    load_dotenv()
+
     jira = get_jira_client()
     if not jira:
         return
@@ -41,8 +92,15 @@ def check_transitions():
     print(f"{'='*80}\n")
     
     try:
-        # Get all issues in the project
-        issues = jira.search_issues(f'project = {project_key}', maxResults=1)
+        # Get one issue in the project. This goes straight to the search
+        # endpoint because search_issues() first downloads the whole /field
+        # catalog to translate field names.
+        issues = jira._get_json("search", params={
+            "jql": f"project = {project_key}",
+            "maxResults": 1,
+            "fields": "summary",
+            "validateQuery": False
+        })["issues"]
         
         if not issues:
             print(f"ℹ️  No issues found in project {project_key}")
@@ -57,13 +115,14 @@ def check_transitions():
             }
             test_issue = jira.create_issue(fields=issue_dict)
             issue_key = test_issue.key
+            _cleanup.append(issue_key)
             print(f"✅ Created test issue: {issue_key}\n")
         else:
-            issue_key = issues[0].key
+            issue_key = issues[0]["key"]
             print(f"✅ Using existing issue: {issue_key}\n")
         
-        # Get transitions for this issue
-        issue = jira.issue(issue_key)
+        # Get transitions for this issue (a single request to
+        # /rest/api/2/issue/{key}/transitions; only id and name are used)
         transitions = jira.transitions(issue_key)
         
         print(f"Available Transitions for {issue_key}:")
@@ -75,15 +134,7 @@ def check_transitions():
                 trans_name = transition.get('name')
                 print(f"  ID: {trans_id:3s} | Name: {trans_name}")
             
-            print(f"\n{'='*80}")
-            print(f"Recommended Status Mapping for your .env or system.py:")
-            print(f"{'='*80}\n")
-            print("Add this to your JIRA config (in system.py or .env):\n")
-            
             # Generate suggested mapping
-            mapping = {}
-            trans_names = [t.get('name').lower() for t in transitions]
-            
             # Smart mapping based on transition names
             status_to_jira = {
                 "investigating": None,
@@ -93,54 +144,58 @@ def check_transitions():
                 "closed": None
             }
             
+            # Lowercase each transition name once; every status scans them
+            named_transitions = [(trans.get('name'), trans.get('name', '').lower()) for trans in transitions]
+            status_keywords = {status: (status.replace('_', ' '), status) for status in status_to_jira}
+            
+            # Index the first transition containing each fallback keyword once,
+            # keeping its position so the earliest match still wins
+            first_by_keyword = {}
+            for position, (name, lower_name) in enumerate(named_transitions):
+                for keyword in FALLBACK_KEYWORDS_ALL:
+                    if keyword in lower_name and keyword not in first_by_keyword:
+                        first_by_keyword[keyword] = (position, name)
+            
             for status in status_to_jira.keys():
                 # Try to find matching transition
-                for trans in transitions:
-                    trans_name = trans.get('name').lower()
-                    if any(keyword in trans_name for keyword in [status.replace('_', ' '), status]):
-                        status_to_jira[status] = trans.get('name')
+                for name, lower_name in named_transitions:
+                    if any(keyword in lower_name for keyword in status_keywords[status]):
+                        status_to_jira[status] = name
                         break
                 
                 # Fallback mappings
                 if status_to_jira[status] is None:
-                    if status == "investigating":
-                        status_to_jira[status] = next((t.get('name') for t in transitions 
-                                                       if 'progress' in t.get('name', '').lower()), None)
-                    elif status == "identified":
-                        status_to_jira[status] = next((t.get('name') for t in transitions 
-                                                       if 'todo' in t.get('name', '').lower() or 'backlog' in t.get('name', '').lower()), None)
-                    elif status == "resolving":
-                        status_to_jira[status] = next((t.get('name') for t in transitions 
-                                                       if 'review' in t.get('name', '').lower() or 'progress' in t.get('name', '').lower()), None)
-                    elif status in ["resolved", "closed"]:
-                        status_to_jira[status] = next((t.get('name') for t in transitions 
-                                                       if 'done' in t.get('name', '').lower() or 'closed' in t.get('name', '').lower()), None)
+                    matches = [first_by_keyword[keyword] for keyword in FALLBACK_KEYWORDS[status]
+                               if keyword in first_by_keyword]
+                    if matches:
+                        status_to_jira[status] = min(matches)[1]
             
-            print("jira_config = {")
-            print(f'    "base_url": "{os.getenv("JIRA_BASE_URL")}",')
-            print(f'    "username": "{os.getenv("JIRA_USERNAME")}",')
-            print(f'    "token": "***",')
-            print(f'    "project_key": "{project_key}",')
-            print(f'    "issue_type": "{os.getenv("JIRA_ISSUE_TYPE", "Task")}",')
-            print('    "status_map": {')
+            # Emit the suggested config block with a single write
+            lines = [
+                "",
+                "=" * 80,
+                "Recommended Status Mapping for your .env or system.py:",
+                "=" * 80,
+                "",
+                "Add this to your JIRA config (in system.py or .env):",
+                "",
+                "jira_config = {",
+                f'    "base_url": "{os.getenv("JIRA_BASE_URL")}",',
+                f'    "username": "{os.getenv("JIRA_USERNAME")}",',
+                '    "token": "***",',
+                f'    "project_key": "{project_key}",',
+                f'    "issue_type": "{os.getenv("JIRA_ISSUE_TYPE", "Task")}",',
+                '    "status_map": {'
+            ]
             
             for status, jira_transition in status_to_jira.items():
                 if jira_transition:
-                    print(f'        "{status}": "{jira_transition}",')
+                    lines.append(f'        "{status}": "{jira_transition}",')
                 else:
-                    print(f'        "{status}": None,  # ⚠️  No suitable transition found')
-            
-            print('    }')
-            print("}\n")
+                    lines.append(f'        "{status}": None,  # ⚠️  No suitable transition found')
             
-            # Clean up test issue if we created one
-            if not issues:
-                print(f"ℹ️  Cleaning up test issue {issue_key}...")
-                try:
-                    jira.delete_issue(issue_key)
-                    print(f"✅ Test issue deleted\n")
-                except:
-                    print(f"⚠️  Could not delete test issue. You can delete {issue_key} manually.\n")
+            lines.extend(['    }', "}", ""])
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"⚠️  No transitions found for {issue_key}")
             print(f"   This might mean the issue is already in a terminal state.\n")
@@ -151,6 +206,9 @@ def check_transitions():
         print(f"  1. Verify JIRA_PROJECT_KEY is correct: {project_key}")
         print(f"  2. Verify you have permissions in the project")
         print(f"  3. Check that JIRA_BASE_URL, JIRA_USERNAME, and JIRA_TOKEN are correct")
+    finally:
+        # Clean up test issues we created, even if the check failed
+        cleanup_test_issues(jira)
 
 if __name__ == "__main__":
     check_transitions()
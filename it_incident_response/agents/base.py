@@ -1,9 +1,10 @@
-import uuid
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 
 from it_incident_response.protocols.a2a import (
-    AgentCard, A2AMessage, A2ATask, TaskState
+    AgentCard, A2AMessage, A2ATask, TaskState, next_uuid
 )
 from it_incident_response.protocols.mcp import MCPHost
 
@@ -17,12 +18,14 @@ class A2AAgent:
         self.mcp_host = mcp_host
         self.mcp_session_id = None
         self.tasks: Dict[str, A2ATask] = {}
-        logger.info(f"Agent initialized: {agent_card.name} ({agent_card.agent_id})")
+        # Runs fire-and-forget MCP calls (e.g. notifications) off the request path
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        logger.info("Agent initialized: %s (%s)", agent_card.name, agent_card.agent_id)
 
         # Initialize MCP session if host is provided
         if mcp_host:
             self.mcp_session_id = mcp_host.create_session(agent_card.agent_id)
-            logger.info(f"MCP session created: {self.mcp_session_id}")
+            logger.info("MCP session created: %s", self.mcp_session_id)
 
     def get_agent_card(self) -> Dict[str, Any]:
         """Return the agent card in JSON format"""
@@ -30,14 +33,14 @@ class A2AAgent:
 
     def create_task(self, initial_message: A2AMessage) -> str:
         """Create a new task with an initial message"""
-        task_id = str(uuid.uuid4())
+        task_id = next_uuid()
         task = A2ATask(
             task_id=task_id,
             state=TaskState.SUBMITTED,
             messages=[initial_message]
         )
         self.tasks[task_id] = task
-        logger.info(f"Task created: {task_id}")
+        logger.info("Task created: %s", task_id)
         return task_id
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -49,12 +52,12 @@ class A2AAgent:
     def send_message(self, task_id: str, message: A2AMessage) -> Optional[Dict[str, Any]]:
         """Send a message to an existing task"""
         if task_id not in self.tasks:
-            logger.error(f"Task not found: {task_id}")
+            logger.error("Task not found: %s", task_id)
             return None
 
         task = self.tasks[task_id]
         task.add_message(message)
-        logger.info(f"Message added to task {task_id}: {message.message_id}")
+        logger.info("Message added to task %s: %s", task_id, message.message_id)
 
         # Process the message and update task state accordingly
         self._process_message(task, message)
@@ -70,7 +73,22 @@ class A2AAgent:
         """
         # Default implementation just updates the state to WORKING
         task.update_state(TaskState.WORKING)
-        logger.warning(f"Default message processing in base class for {self.agent_card.name}")
+        logger.warning("Default message processing in base class for %s", self.agent_card.name)
+
+    async def _process_message_async(self, task: A2ATask, message: A2AMessage) -> None:
+        """
+        Process an incoming message from async code
+
+        By default the synchronous _process_message runs in the loop's
+        executor. Agents that can overlap their own I/O override this.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._process_message, task, message)
+
+    def _complete_task(self, task: A2ATask, response: A2AMessage) -> None:
+        """Add the agent's response to the task and mark the task completed"""
+        task.add_message(response)
+        task.update_state(TaskState.COMPLETED)
 
     def execute_mcp_tool(self, tool_id: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute a tool through MCP if available"""
@@ -90,6 +108,8 @@ class A2AAgent:
 
     def cleanup(self) -> None:
         """Clean up resources used by the agent"""
+        # Let background MCP calls finish while the session is still open
+        self._executor.shutdown(wait=True)
         if self.mcp_host and self.mcp_session_id:
             self.mcp_host.end_session(self.mcp_session_id)
-            logger.info(f"MCP session ended for agent {self.agent_card.name}")
\ No newline at end of file
+            logger.info("MCP session ended for agent %s", self.agent_card.name)
\ No newline at end of file
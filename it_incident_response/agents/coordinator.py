@@ -1,17 +1,18 @@
-import uuid
 import logging
 import datetime
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional, Callable, Tuple
 
 from it_incident_response.agents.base import A2AAgent
 from it_incident_response.protocols.a2a import (
     AgentCard, AgentCapability, A2AMessage, A2ATask,
-    TaskState, PartType, MessagePart
+    TaskState, PartType, MessagePart, next_uuid
 )
 from it_incident_response.protocols.mcp import MCPHost
 from it_incident_response.models.incident import (
     create_incident, get_incident_by_id, update_incident_status,
-    assign_incident, add_incident_note, set_incident_metadata
+    assign_incident, add_incident_note, set_incident_metadata_bulk
 )
 
 logger = logging.getLogger("it-incident-response.agents.coordinator")
@@ -52,18 +53,35 @@ class IncidentCoordinatorAgent(A2AAgent):
                         "status": {"type": "string", "enum": ["investigating", "identified", "resolving", "resolved", "closed"]},
                         "notes": {"type": "string", "description": "Additional notes"}
                     }
+                ),
+                AgentCapability(
+                    name="update_incidents",
+                    description="Update several incidents in one request",
+                    parameters={
+                        "updates": {"type": "array", "items": {"type": "object"}, "description": "update_incident requests"}
+                    }
                 )
             ]
         )
         super().__init__(agent_card, mcp_host)
         self.diagnostic_agent_id = None
         self.resolution_agent_id = None
+        # Alerts queued while processing a message, sent in one bulk MCP call
+        self._alert_buffer: List[Dict[str, Any]] = []
+        self._alert_lock = threading.Lock()
+        # Capability name -> handler; each handler fills in the response
+        self._handlers: Dict[str, Callable[[Dict[str, Any], A2AMessage], None]] = {
+            "create_incident": self._handle_create,
+            "get_incident_status": self._handle_status,
+            "update_incident": self._handle_update,
+            "update_incidents": self._handle_updates
+        }
 
     def set_collaborating_agents(self, diagnostic_agent_id: str, resolution_agent_id: str):
         """Set the IDs of collaborating agents"""
         self.diagnostic_agent_id = diagnostic_agent_id
         self.resolution_agent_id = resolution_agent_id
-        logger.info(f"Collaborating agents set: diagnostic={diagnostic_agent_id}, resolution={resolution_agent_id}")
+        logger.info("Collaborating agents set: diagnostic=%s, resolution=%s", diagnostic_agent_id, resolution_agent_id)
 
     def _process_message(self, task: A2ATask, message: A2AMessage) -> None:
         """Process incoming messages to the coordinator"""
@@ -78,178 +96,245 @@ class IncidentCoordinatorAgent(A2AAgent):
 
         # Create response message
         response = A2AMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=next_uuid(),
             role="agent"
         )
 
-        # Process based on the requested capability
-        if "create_incident" in request_data:
-            # Create a new incident
-            incident_data = request_data["create_incident"]
-
-            incident_id = create_incident(
-                title=incident_data.get("title", "Unknown incident"),
-                description=incident_data.get("description", ""),
-                severity=incident_data.get("severity", "medium"),
-                affected_systems=incident_data.get("affected_systems", []),
-                tags=incident_data.get("tags", [])
-            )
-
-            # Use MCP to log the incident in the ticketing system
-            ticket_result = self.execute_mcp_tool("ticketing-system", {
-                "action": "create_ticket",
-                "data": get_incident_by_id(incident_id)
-            })
+        # Dispatch on the first requested capability this agent handles
+        capability = next((key for key in self._handlers if key in request_data), None)
+        if capability:
+            self._handlers[capability](request_data[capability], response)
+        else:
+            response.add_text_part("Unknown request")
+
+        # Send any notifications queued while handling the request
+        self._flush_alerts()
+
+        # Add the response to the task
+        self._complete_task(task, response)
+
+    def _handle_create(self, data: Dict[str, Any], response: A2AMessage) -> None:
+        """Create an incident, open its ticket and assign it for diagnosis"""
+        incident_id = create_incident(
+            title=data.get("title", "Unknown incident"),
+            description=data.get("description", ""),
+            severity=data.get("severity", "medium"),
+            affected_systems=data.get("affected_systems", []),
+            tags=data.get("tags", [])
+        )
+
+        # Snapshot the incident once; the ticket gets it as it was before
+        # the assignment updates it
+        incident = get_incident_by_id(incident_id)
+        ticket_request = {
+            "action": "create_ticket",
+            "data": incident
+        }
+
+        # Assign to diagnostic agent if available
+        if self.diagnostic_agent_id:
+            self._assign_to_diagnostic_agent(incident_id, incident)
+
+        # Send the assignment notification in the background, then log the
+        # incident in the ticketing system
+        self._flush_alerts()
+        ticket_result = self.execute_mcp_tool("ticketing-system", ticket_request)
+        
+        # If the ticketing system created a JIRA issue, capture the key and URL
+        if ticket_result.get("status") == "success":
+            self._persist_jira_metadata(incident_id, ticket_result.get("data", {}).get("ticket", {}))
+
+        # Add response parts (re-read to include the assignment and JIRA metadata)
+        response.add_text_part(f"Incident created with ID: {incident_id}")
+        response.add_json_part({"incident": get_incident_by_id(incident_id)})
+
+    def _persist_jira_metadata(self, incident_id: str, ticket_data: Dict[str, Any]) -> None:
+        """Store a ticket's JIRA issue key and URL on the incident"""
+        meta_updates = {}
+        if "jira_issue_key" in ticket_data:
+            meta_updates["jira_issue_key"] = ticket_data["jira_issue_key"]
+        if ticket_data.get("jira_issue_url"):
+            meta_updates["jira_issue_url"] = ticket_data["jira_issue_url"]
+
+        if meta_updates:
+            # Persist both values into the Incident object in one write
+            updated = set_incident_metadata_bulk(incident_id, meta_updates)
+            if "jira_issue_key" in updated:
+                if updated["jira_issue_key"]:
+                    logger.info("JIRA issue created for incident %s: %s", incident_id, meta_updates['jira_issue_key'])
+                else:
+                    logger.warning("Failed to persist JIRA issue key for incident %s", incident_id)
+            if "jira_issue_url" in updated:
+                if updated["jira_issue_url"]:
+                    logger.info("Persisted JIRA issue URL for incident %s: %s", incident_id, meta_updates['jira_issue_url'])
+                else:
+                    logger.warning("Failed to persist JIRA issue URL for incident %s", incident_id)
+
+    def _handle_status(self, data: Dict[str, Any], response: A2AMessage) -> None:
+        """Report the current status of an incident"""
+        incident_id = data.get("incident_id")
+        incident = get_incident_by_id(incident_id)
+
+        if incident:
+            response.add_text_part(f"Current status of incident {incident_id}: {incident.get('status')}")
+            response.add_json_part({"incident": incident})
+        else:
+            response.add_text_part(f"Incident {incident_id} not found")
+
+    def _handle_update(self, data: Dict[str, Any], response: A2AMessage) -> None:
+        """Update an incident's status and sync the ticket"""
+        updated_incident, summary = self._apply_update(data)
+        response.add_text_part(summary)
+        if updated_incident is not None:
+            response.add_json_part({"incident": updated_incident})
+
+    def _handle_updates(self, data: Dict[str, Any], response: A2AMessage) -> None:
+        """Apply a batch of incident updates and report them in one response"""
+        updates = data.get("updates", [])
+        incidents = []
+        for update in updates:
+            updated_incident, summary = self._apply_update(update)
+            if updated_incident is None:
+                logger.warning(summary)
+            incidents.append(updated_incident or {})
+
+        updated_count = sum(1 for incident in incidents if incident)
+        response.add_text_part(f"{updated_count} of {len(updates)} incidents updated")
+        response.add_json_part({"incidents": incidents})
+
+    def _apply_update(self, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Apply one update request, returning the updated incident (None on failure) and a summary"""
+        incident_id = data.get("incident_id")
+
+        incident = get_incident_by_id(incident_id)
+        if not incident:
+            return None, f"Incident {incident_id} not found"
+
+        # Update status if provided
+        if "status" in data:
+            status = data["status"]
+            notes = data.get("notes")
+            remediation_steps = data.get("remediation_steps", [])
+
+            success = update_incident_status(incident_id, status, notes)
+            if not success:
+                return None, f"Failed to update incident status to {status}"
+
+            # Update ticket in ticketing system
+            ticket_update = {
+                "status": status,
+                "notes": notes
+            }
             
-            # If the ticketing system created a JIRA issue, capture the key
-            if ticket_result.get("status") == "success":
-                ticket_data = ticket_result.get("data", {}).get("ticket", {})
-                if "jira_issue_key" in ticket_data:
-                    issue_key = ticket_data["jira_issue_key"]
-                    # Persist the jira_issue_key into the Incident object
-                    updated = set_incident_metadata(incident_id, "jira_issue_key", issue_key)
-                    if updated:
-                        logger.info(f"JIRA issue created for incident {incident_id}: {issue_key}")
-                    else:
-                        logger.warning(f"Failed to persist JIRA issue key for incident {incident_id}")
-                # Also persist the JIRA issue URL if provided
-                if "jira_issue_url" in ticket_data:
-                    issue_url = ticket_data["jira_issue_url"]
-                    if issue_url:
-                        updated_url = set_incident_metadata(incident_id, "jira_issue_url", issue_url)
-                        if updated_url:
-                            logger.info(f"Persisted JIRA issue URL for incident {incident_id}: {issue_url}")
-                        else:
-                            logger.warning(f"Failed to persist JIRA issue URL for incident {incident_id}")
-
-            # Assign to diagnostic agent if available
-            if self.diagnostic_agent_id:
-                self._assign_to_diagnostic_agent(incident_id)
-
-            # Add response parts
-            response.add_text_part(f"Incident created with ID: {incident_id}")
-            response.add_json_part({"incident": get_incident_by_id(incident_id)})
-
-        elif "get_incident_status" in request_data:
-            # Get incident status
-            incident_id = request_data["get_incident_status"].get("incident_id")
-            incident = get_incident_by_id(incident_id)
-
-            if incident:
-                response.add_text_part(f"Current status of incident {incident_id}: {incident.get('status')}")
-                response.add_json_part({"incident": incident})
-            else:
-                response.add_text_part(f"Incident {incident_id} not found")
-
-        elif "update_incident" in request_data:
-            # Update incident
-            incident_data = request_data["update_incident"]
-            incident_id = incident_data.get("incident_id")
-
-            incident = get_incident_by_id(incident_id)
-            if not incident:
-                response.add_text_part(f"Incident {incident_id} not found")
-                task.add_message(response)
-                task.update_state(TaskState.COMPLETED)
-                return
+            # Add remediation steps to ticket update if present
+            if remediation_steps:
+                ticket_update["remediation_steps"] = remediation_steps
+            
+            self.execute_mcp_tool("ticketing-system", {
+                "action": "update_ticket",
+                "ticket_id": incident_id,
+                "data": ticket_update
+            })
 
-            # Update status if provided
-            if "status" in incident_data:
-                status = incident_data["status"]
-                notes = incident_data.get("notes")
-                remediation_steps = incident_data.get("remediation_steps", [])
-
-                success = update_incident_status(incident_id, status, notes)
-                if not success:
-                    response.add_text_part(f"Failed to update incident status to {status}")
-                    task.add_message(response)
-                    task.update_state(TaskState.COMPLETED)
-                    return
-
-                # Update ticket in ticketing system
-                ticket_update = {
-                    "status": status,
-                    "notes": notes
-                }
-                
-                # Add remediation steps to ticket update if present
-                if remediation_steps:
-                    ticket_update["remediation_steps"] = remediation_steps
-                
-                self.execute_mcp_tool("ticketing-system", {
-                    "action": "update_ticket",
-                    "ticket_id": incident_id,
-                    "data": ticket_update
+            # If status changed to "identified", assign to resolution agent
+            if status == "identified" and self.resolution_agent_id:
+                self._assign_to_resolution_agent(incident_id, incident)
+
+            # If status changed to "resolved", send notification
+            if status == "resolved":
+                # Notes travel as their own field rather than being copied into the message
+                msg_parts = [
+                    f"The incident '{incident.get('title')}' has been resolved.",
+                    f"Actions Taken: {len(remediation_steps)}"
+                ]
+                self._queue_alert({
+                    "recipients": ["it-team@example.com", "stakeholders@example.com"],
+                    "subject": f"Incident {incident_id} Resolved",
+                    "message": "\n\n".join(msg_parts),
+                    "notes": notes,
+                    "severity": "info"
                 })
 
-                # If status changed to "identified", assign to resolution agent
-                if status == "identified" and self.resolution_agent_id:
-                    self._assign_to_resolution_agent(incident_id)
-
-                # If status changed to "resolved", send notification
-                if status == "resolved":
-                    self.execute_mcp_tool("alert-system", {
-                        "action": "create_alert",
-                        "recipients": ["it-team@example.com", "stakeholders@example.com"],
-                        "subject": f"Incident {incident_id} Resolved",
-                        "message": f"The incident '{incident.get('title')}' has been resolved.\n\nNotes: {notes}\n\nActions Taken: {len(remediation_steps)}",
-                        "severity": "info"
-                    })
-
-            # Get updated incident
-            updated_incident = get_incident_by_id(incident_id)
-            response.add_text_part(f"Incident {incident_id} updated")
-            response.add_json_part({"incident": updated_incident})
+        # Get updated incident
+        return get_incident_by_id(incident_id), f"Incident {incident_id} updated"
 
-        else:
-            response.add_text_part("Unknown request")
+    def _queue_alert(self, alert: Dict[str, Any]) -> None:
+        """Queue an alert for the next flush; requests may run on several threads"""
+        with self._alert_lock:
+            self._alert_buffer.append(alert)
 
-        # Add the response to the task
-        task.add_message(response)
-        task.update_state(TaskState.COMPLETED)
+    def _flush_alerts(self) -> None:
+        """Hand all queued alerts to the alert system in one background MCP call"""
+        with self._alert_lock:
+            if not self._alert_buffer:
+                return
+            alerts, self._alert_buffer = self._alert_buffer, []
+
+        # Systems started without the alert tool (minimal mode) send no notifications
+        if not self.mcp_host or not self.mcp_host.has_tool("alert-system"):
+            logger.debug("Alert system not registered; dropping %s queued alert(s)", len(alerts))
+            return
+
+        try:
+            future = self._executor.submit(self.execute_mcp_tool, "alert-system", {
+                "action": "create_alerts_bulk",
+                "alerts": alerts
+            })
+        except RuntimeError:
+            # The agent has been cleaned up and its executor no longer accepts work
+            logger.warning("Coordinator is shut down; dropping %s queued alert(s)", len(alerts))
+            return
+        future.add_done_callback(lambda done: self._log_alert_result(done, len(alerts)))
+
+    @staticmethod
+    def _log_alert_result(future: Future, count: int) -> None:
+        """Log a failed background alert delivery"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.warning("Failed to send %s queued alert(s): %s", count, e)
+            return
+        if result.get("status") != "success":
+            logger.warning("Failed to send %s queued alert(s): %s", count, result.get('message'))
 
-    def _assign_to_diagnostic_agent(self, incident_id: str) -> None:
+    def _assign_to_diagnostic_agent(self, incident_id: str, incident: Dict[str, Any]) -> None:
         """Assign an incident to the diagnostic agent for analysis"""
         if not self.diagnostic_agent_id:
             logger.warning("Diagnostic agent not set")
             return
 
-        logger.info(f"Assigning incident {incident_id} to diagnostic agent")
+        logger.info("Assigning incident %s to diagnostic agent", incident_id)
 
         # In a real implementation, this would use A2A to communicate with the diagnostic agent
         # For this prototype, we'll just log the assignment and update the incident
-        incident = get_incident_by_id(incident_id)
         if incident:
             assign_incident(incident_id, f"diagnostic-agent:{self.diagnostic_agent_id}")
             add_incident_note(incident_id, f"Assigned to diagnostic agent for analysis")
 
-            # Send notification via alert system
-            self.execute_mcp_tool("alert-system", {
-                "action": "create_alert",
+            # Queue notification for the alert system
+            self._queue_alert({
                 "recipients": ["it-team@example.com"],
                 "subject": f"Incident {incident_id} Assigned for Diagnosis",
                 "message": f"The incident '{incident.get('title')}' has been assigned to the diagnostic agent for analysis.",
                 "severity": incident.get("severity", "medium")
             })
 
-    def _assign_to_resolution_agent(self, incident_id: str) -> None:
+    def _assign_to_resolution_agent(self, incident_id: str, incident: Dict[str, Any]) -> None:
         """Assign an incident to the resolution agent for remediation"""
         if not self.resolution_agent_id:
             logger.warning("Resolution agent not set")
             return
 
-        logger.info(f"Assigning incident {incident_id} to resolution agent")
+        logger.info("Assigning incident %s to resolution agent", incident_id)
 
         # In a real implementation, this would use A2A to communicate with the resolution agent
         # For this prototype, we'll just log the assignment and update the incident
-        incident = get_incident_by_id(incident_id)
         if incident:
             assign_incident(incident_id, f"resolution-agent:{self.resolution_agent_id}")
             add_incident_note(incident_id, f"Assigned to resolution agent for implementation")
 
-            # Send notification via alert system
-            self.execute_mcp_tool("alert-system", {
-                "action": "create_alert",
+            # Queue notification for the alert system
+            self._queue_alert({
                 "recipients": ["it-team@example.com"],
                 "subject": f"Incident {incident_id} Assigned for Resolution",
                 "message": f"The incident '{incident.get('title')}' has been assigned to the resolution agent for implementation.",
@@ -1,4 +1,3 @@
-import uuid
 import logging
 import datetime
 import time
@@ -7,7 +6,7 @@ from typing import Dict, List, Any, Optional
 from it_incident_response.agents.base import A2AAgent
 from it_incident_response.protocols.a2a import (
     AgentCard, AgentCapability, A2AMessage, A2ATask,
-    TaskState, PartType, MessagePart
+    TaskState, PartType, MessagePart, next_uuid
 )
 from it_incident_response.protocols.mcp import MCPHost
 from it_incident_response.models.incident import get_incident_by_id, update_incident_status, add_incident_note
@@ -60,7 +59,7 @@ class DiagnosticAgent(A2AAgent):
 
         # Create response message
         response = A2AMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=next_uuid(),
             role="agent"
         )
 
@@ -68,13 +67,12 @@ class DiagnosticAgent(A2AAgent):
         if "analyze_incident" in request_data:
             # Analyze an incident
             incident_id = request_data["analyze_incident"].get("incident_id")
-            logger.info(f"Analyzing incident: {incident_id}")
+            logger.info("Analyzing incident: %s", incident_id)
 
             incident = get_incident_by_id(incident_id)
             if not incident:
                 response.add_text_part(f"Incident {incident_id} not found")
-                task.add_message(response)
-                task.update_state(TaskState.COMPLETED)
+                self._complete_task(task, response)
                 return
 
             # Create a diagnostic report
@@ -239,5 +237,4 @@ class DiagnosticAgent(A2AAgent):
             response.add_text_part("Unknown request")
 
         # Add the response to the task
-        task.add_message(response)
-        task.update_state(TaskState.COMPLETED)
+        self._complete_task(task, response)
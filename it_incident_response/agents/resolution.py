@@ -1,4 +1,3 @@
-import uuid
 import logging
 import datetime
 import time
@@ -7,7 +6,7 @@ from typing import Dict, List, Any, Optional
 from it_incident_response.agents.base import A2AAgent
 from it_incident_response.protocols.a2a import (
     AgentCard, AgentCapability, A2AMessage, A2ATask,
-    TaskState, PartType, MessagePart
+    TaskState, PartType, MessagePart, next_uuid
 )
 from it_incident_response.protocols.mcp import MCPHost
 from it_incident_response.models.incident import get_incident_by_id, update_incident_status, add_incident_note
@@ -59,7 +58,7 @@ class ResolutionAgent(A2AAgent):
 
         # Create response message
         response = A2AMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=next_uuid(),
             role="agent"
         )
 
@@ -72,19 +71,17 @@ class ResolutionAgent(A2AAgent):
             incident = get_incident_by_id(incident_id)
             if not incident:
                 response.add_text_part(f"Incident {incident_id} not found")
-                task.add_message(response)
-                task.update_state(TaskState.COMPLETED)
+                self._complete_task(task, response)
                 return
 
             # Get diagnostic report for this incident
             diagnostic_report = get_report_by_incident_id(incident_id)
             if not diagnostic_report:
                 response.add_text_part(f"No diagnostic report found for incident {incident_id}")
-                task.add_message(response)
-                task.update_state(TaskState.COMPLETED)
+                self._complete_task(task, response)
                 return
 
-            logger.info(f"Implementing resolution for incident: {incident_id}")
+            logger.info("Implementing resolution for incident: %s", incident_id)
 
             # Determine actions based on root cause
             root_cause = diagnostic_report.get("root_cause", "")
@@ -275,5 +272,4 @@ class ResolutionAgent(A2AAgent):
             response.add_text_part("Unknown request")
 
         # Add the response to the task
-        task.add_message(response)
-        task.update_state(TaskState.COMPLETED)
\ No newline at end of file
+        self._complete_task(task, response)
\ No newline at end of file
@@ -1,10 +1,11 @@
 import uuid
 import datetime
+import threading
 from enum import Enum
 from typing import Dict, List, Any, Optional
 
 from it_incident_response.simulation.incident_data import (
-    get_random_incident, get_incident_by_index, SIMULATED_INCIDENTS
+    get_random_incident, SIMULATED_INCIDENTS
 )
 
 class IncidentSeverity(Enum):
@@ -85,6 +86,41 @@ class Incident:
 # Global incident store for the simulation
 _incidents: Dict[str, Incident] = {}
 
+# Dictionary representations of incidents, rebuilt lazily after each write
+_incident_dict_cache: Dict[str, Dict[str, Any]] = {}
+# Snapshot of every incident's dictionary for get_all_incidents
+_incident_list_cache: Optional[List[Dict[str, Any]]] = None
+# Bumped on every write (per incident, and for the store as a whole), so a
+# reader that built a dictionary while a write happened doesn't cache it
+_incident_versions: Dict[str, int] = {}
+_store_version = 0
+_incident_cache_lock = threading.Lock()
+
+def _invalidate_incident_cache(incident_id: str) -> None:
+    """Drop the cached dictionaries for an incident after it changes"""
+    global _incident_list_cache, _store_version
+    with _incident_cache_lock:
+        _incident_versions[incident_id] = _incident_versions.get(incident_id, 0) + 1
+        _store_version += 1
+        _incident_dict_cache.pop(incident_id, None)
+        _incident_list_cache = None
+
+def _cached_incident_dict(incident_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached dictionary for an incident, building it if needed"""
+    with _incident_cache_lock:
+        cached = _incident_dict_cache.get(incident_id)
+        version = _incident_versions.get(incident_id, 0)
+    if cached is None:
+        incident = _incidents.get(incident_id)
+        if incident is None:
+            return None
+        cached = incident.to_dict()
+        with _incident_cache_lock:
+            # Only cache it if no write landed while it was being built
+            if _incident_versions.get(incident_id, 0) == version:
+                _incident_dict_cache[incident_id] = cached
+    return cached
+
 def create_incident(title: str, description: str, severity: str,
                     affected_systems: List[str], tags: List[str] = None) -> str:
     """Create a new incident and store it"""
@@ -106,13 +142,16 @@ def create_incident(title: str, description: str, severity: str,
     )
 
     _incidents[incident_id] = incident
+    _invalidate_incident_cache(incident_id)
     return incident_id
 
 def get_incident_by_id(incident_id: str) -> Optional[Dict[str, Any]]:
     """Get an incident by ID, returning its dictionary representation"""
-    if incident_id in _incidents:
-        return _incidents[incident_id].to_dict()
-    return None
+    cached = _cached_incident_dict(incident_id)
+    if cached is None:
+        return None
+    # Shallow copy so callers can't alter the cached entry
+    return dict(cached)
 
 
 def set_incident_metadata(incident_id: str, key: str, value: Any) -> bool:
@@ -125,8 +164,23 @@ def set_incident_metadata(incident_id: str, key: str, value: Any) -> bool:
 
     _incidents[incident_id].metadata[key] = value
     _incidents[incident_id].updated_time = datetime.datetime.now().isoformat()
+    _invalidate_incident_cache(incident_id)
     return True
 
+def set_incident_metadata_bulk(incident_id: str, mapping: Dict[str, Any]) -> Dict[str, bool]:
+    """Set several metadata key/values on an incident in a single update.
+
+    Returns a dict mapping each key to True if it was stored, False otherwise.
+    """
+    if incident_id not in _incidents:
+        return {key: False for key in mapping}
+
+    incident = _incidents[incident_id]
+    incident.metadata.update(mapping)
+    incident.updated_time = datetime.datetime.now().isoformat()
+    _invalidate_incident_cache(incident_id)
+    return {key: True for key in mapping}
+
 def update_incident_status(incident_id: str, status: str, note: str = None) -> bool:
     """Update the status of an incident"""
     if incident_id not in _incidents:
@@ -139,6 +193,7 @@ def update_incident_status(incident_id: str, status: str, note: str = None) -> b
         return False
 
     _incidents[incident_id].update_status(status_enum, note)
+    _invalidate_incident_cache(incident_id)
     return True
 
 def assign_incident(incident_id: str, assignee: str) -> bool:
@@ -147,6 +202,7 @@ def assign_incident(incident_id: str, assignee: str) -> bool:
         return False
 
     _incidents[incident_id].assign_to(assignee)
+    _invalidate_incident_cache(incident_id)
     return True
 
 def add_incident_note(incident_id: str, note: str) -> bool:
@@ -155,26 +211,44 @@ def add_incident_note(incident_id: str, note: str) -> bool:
         return False
 
     _incidents[incident_id].add_note(note)
+    _invalidate_incident_cache(incident_id)
     return True
 
 def get_all_incidents() -> List[Dict[str, Any]]:
     """Get all incidents as dictionary representations"""
-    return [incident.to_dict() for incident in _incidents.values()]
+    global _incident_list_cache
+    with _incident_cache_lock:
+        snapshot = _incident_list_cache
+        version = _store_version
+    if snapshot is None:
+        snapshot = [
+            _cached_incident_dict(incident_id) for incident_id in list(_incidents)
+        ]
+        with _incident_cache_lock:
+            if _store_version == version:
+                _incident_list_cache = snapshot
+    # Shallow copies so callers can't alter the cached entries
+    return [dict(incident) for incident in snapshot]
+
+def get_latest_incident() -> Optional[Dict[str, Any]]:
+    """Get the most recently created incident, or None if there are none"""
+    # The store keeps creation order, so the newest incident is its last key
+    try:
+        incident_id = next(reversed(_incidents))
+    except StopIteration:
+        return None
+    return get_incident_by_id(incident_id)
 
 def load_simulated_incidents(count: int = 3) -> List[str]:
     """Load a number of simulated incidents into the system"""
-    incident_ids = []
-
-    # Load predefined incidents
-    for i in range(min(count, len(SIMULATED_INCIDENTS))):
-        incident_data = get_incident_by_index(i)
-        incident_id = create_incident(
+    # Load predefined incidents; slicing caps count at the number available
+    return [
+        create_incident(
             title=incident_data["title"],
             description=incident_data["description"],
             severity=incident_data["severity"],
             affected_systems=incident_data["affected_systems"],
             tags=incident_data.get("tags", [])
         )
-        incident_ids.append(incident_id)
-
-    return incident_ids
\ No newline at end of file
+        for incident_data in SIMULATED_INCIDENTS[:count]
+    ]
\ No newline at end of file
@@ -1,13 +1,43 @@
+import os
 import uuid
 import json
 import logging
 import datetime
+import threading
+from collections import deque
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Deque, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 
 logger = logging.getLogger("it-incident-response.a2a")
 
+# Random bytes for message, part and task IDs are read from the OS in bulk
+# rather than with one urandom call per ID
+_UUID_POOL_SIZE = 1024
+_uuid_pool: Deque[bytes] = deque()
+_uuid_pool_lock = threading.Lock()
+
+def next_uuid() -> str:
+    """Return a random (version 4) UUID string, drawing from a pre-read pool of random bytes"""
+    while True:
+        try:
+            return str(uuid.UUID(bytes=_uuid_pool.popleft(), version=4))
+        except IndexError:
+            with _uuid_pool_lock:
+                if not _uuid_pool:
+                    data = os.urandom(16 * _UUID_POOL_SIZE)
+                    _uuid_pool.extend(data[i:i + 16] for i in range(0, len(data), 16))
+
+def _reset_uuid_pool() -> None:
+    """Discard pooled bytes in a forked child so it never repeats the parent's IDs"""
+    global _uuid_pool_lock
+    _uuid_pool.clear()
+    # The lock may have been held by another parent thread at fork time
+    _uuid_pool_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
 class PartType(Enum):
     """Types of content parts in A2A messages"""
     TEXT = "text/plain"
@@ -53,6 +83,9 @@ class AgentCard:
 @dataclass
 class MessagePart:
     """A part within an A2A message"""
+    # Fixed attribute layout; every message carries at least one part
+    __slots__ = ("part_id", "content_type", "content")
+
     part_id: str
     content_type: PartType
     content: Any
@@ -74,7 +107,7 @@ class A2AMessage:
 
     def add_text_part(self, text: str) -> str:
         """Add a text part to the message and return its ID"""
-        part_id = str(uuid.uuid4())
+        part_id = next_uuid()
         self.parts.append(
             MessagePart(
                 part_id=part_id,
@@ -86,7 +119,7 @@ class A2AMessage:
 
     def add_json_part(self, data: Dict[str, Any]) -> str:
         """Add a JSON part to the message and return its ID"""
-        part_id = str(uuid.uuid4())
+        part_id = next_uuid()
         self.parts.append(
             MessagePart(
                 part_id=part_id,
@@ -122,10 +155,17 @@ class A2ATask:
     artifacts: List[Dict[str, Any]] = field(default_factory=list)
     created_at: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.datetime.now().isoformat())
+    # JSON payload of the most recent agent message, kept up to date by add_message
+    last_agent_json: Optional[Dict[str, Any]] = None
 
     def add_message(self, message: A2AMessage) -> None:
         """Add a message to the task"""
         self.messages.append(message)
+        if message.role == "agent":
+            for part in message.parts:
+                if part.content_type == PartType.JSON:
+                    self.last_agent_json = part.content
+                    break
         self.updated_at = datetime.datetime.now().isoformat()
 
     def update_state(self, new_state: TaskState) -> None:
@@ -1,8 +1,9 @@
 import uuid
 import logging
 import datetime
+import threading
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger("it-incident-response.mcp")
@@ -36,7 +37,7 @@ class MCPTool:
         In a real implementation, this would make an API call to the actual tool.
         For the prototype, responses are simulated.
         """
-        logger.info(f"Executing MCP tool: {self.name}")
+        logger.info("Executing MCP tool: %s", self.name)
 
         # Implementation details will be in each tool's specific module
         # This is just the interface definition
@@ -50,13 +51,49 @@ class MCPHost:
 
     def __init__(self):
         self.tools: Dict[str, MCPTool] = {}
+        # Tools registered by factory are only built when first needed
+        self._factories: Dict[str, Callable[[], MCPTool]] = {}
+        self._factory_lock = threading.Lock()
+        # Tool IDs in registration order, whether built yet or not
+        self._tool_order: List[str] = []
         self.sessions: Dict[str, Dict[str, Any]] = {}
         logger.info("MCP Host initialized")
 
     def register_tool(self, tool: MCPTool):
         """Register a tool with the MCP Host"""
+        if not self.has_tool(tool.tool_id):
+            self._tool_order.append(tool.tool_id)
         self.tools[tool.tool_id] = tool
-        logger.info(f"Tool registered: {tool.name} ({tool.tool_id})")
+        logger.info("Tool registered: %s (%s)", tool.name, tool.tool_id)
+
+    def register_factory(self, tool_id: str, factory: Callable[[], MCPTool]):
+        """Register a tool that is only instantiated when it is first used"""
+        if not self.has_tool(tool_id):
+            self._tool_order.append(tool_id)
+        self._factories[tool_id] = factory
+        logger.info("Tool factory registered: %s", tool_id)
+
+    def has_tool(self, tool_id: str) -> bool:
+        """Check whether a tool is registered, instantiated or not"""
+        return tool_id in self.tools or tool_id in self._factories
+
+    def _get_tool(self, tool_id: str) -> Optional[MCPTool]:
+        """Look up a tool, instantiating it from its factory on first use"""
+        tool = self.tools.get(tool_id)
+        if tool is None and tool_id in self._factories:
+            with self._factory_lock:
+                tool = self.tools.get(tool_id)
+                factory = self._factories.get(tool_id)
+                if tool is None and factory is not None:
+                    # The factory is only dropped once it has built the tool,
+                    # so a failed construction can be retried on the next call
+                    tool = factory()
+                    if tool.tool_id != tool_id:
+                        logger.warning("Tool factory for %s built tool %s", tool_id, tool.tool_id)
+                    self.tools[tool_id] = tool
+                    del self._factories[tool_id]
+                    logger.info("Tool instantiated on first use: %s (%s)", tool.name, tool_id)
+        return tool
 
     def create_session(self, agent_id: str) -> str:
         """Create a new session for an agent"""
@@ -67,42 +104,66 @@ class MCPHost:
             "active": True,
             "context": {}
         }
-        logger.info(f"Session created for agent {agent_id}: {session_id}")
+        logger.info("Session created for agent %s: %s", agent_id, session_id)
         return session_id
 
-    def execute_tool(self, session_id: str, tool_id: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Execute a tool through MCP"""
-        if session_id not in self.sessions:
-            logger.error(f"Invalid session ID: {session_id}")
-            return {"status": "error", "message": "Invalid session ID"}
+    def _resolve_tool(self, session_id: str, tool_id: str) -> Tuple[Optional[MCPTool], Optional[Dict[str, Any]]]:
+        """Validate the session and look up the tool, returning (tool, error)"""
+        # Agents keep one session for their lifetime, so each call only
+        # needs a single lookup to validate it
+        session = self.sessions.get(session_id)
+        if session is None:
+            logger.error("Invalid session ID: %s", session_id)
+            return None, {"status": "error", "message": "Invalid session ID"}
 
-        if not self.sessions[session_id]["active"]:
-            logger.error(f"Session {session_id} is not active")
-            return {"status": "error", "message": "Session is not active"}
+        if not session["active"]:
+            logger.error("Session %s is not active", session_id)
+            return None, {"status": "error", "message": "Session is not active"}
 
-        if tool_id not in self.tools:
-            logger.error(f"Tool not found: {tool_id}")
-            return {"status": "error", "message": "Tool not found"}
+        try:
+            tool = self._get_tool(tool_id)
+        except Exception as e:
+            logger.error("Error creating tool %s: %s", tool_id, e)
+            return None, {"status": "error", "message": str(e)}
+        if tool is None:
+            logger.error("Tool not found: %s", tool_id)
+            return None, {"status": "error", "message": "Tool not found"}
+
+        return tool, None
+
+    def execute_tool(self, session_id: str, tool_id: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Execute a tool through MCP"""
+        tool, error = self._resolve_tool(session_id, tool_id)
+        if error:
+            return error
 
-        tool = self.tools[tool_id]
         try:
             result = tool.execute(parameters or {})
-            logger.info(f"Tool {tool.name} executed successfully via MCP")
+            logger.info("Tool %s executed successfully via MCP", tool.name)
             return result
         except Exception as e:
-            logger.error(f"Error executing tool {tool.name}: {str(e)}")
+            logger.error("Error executing tool %s: %s", tool.name, e)
             return {"status": "error", "message": str(e)}
 
     def get_available_tools(self, session_id: str) -> List[Dict[str, Any]]:
         """Get list of available tools for the session"""
         if session_id not in self.sessions:
-            logger.error(f"Invalid session ID: {session_id}")
+            logger.error("Invalid session ID: %s", session_id)
             return []
 
         if not self.sessions[session_id]["active"]:
-            logger.error(f"Session {session_id} is not active")
+            logger.error("Session %s is not active", session_id)
             return []
 
+        # Listing needs each tool's metadata, so build any pending tools
+        for tool_id in list(self._factories):
+            try:
+                self._get_tool(tool_id)
+            except Exception as e:
+                logger.error("Error creating tool %s: %s", tool_id, e)
+
+        # Tools are listed in the order they were registered, not built
+        tools = (self.tools.get(tool_id) for tool_id in self._tool_order)
         return [
             {
                 "tool_id": tool.tool_id,
@@ -111,15 +172,15 @@ class MCPHost:
                 "tool_type": tool.tool_type.value,
                 "parameters": tool.parameters
             }
-            for tool in self.tools.values()
+            for tool in tools if tool is not None
         ]
 
     def end_session(self, session_id: str) -> bool:
         """End an MCP session"""
         if session_id not in self.sessions:
-            logger.error(f"Invalid session ID: {session_id}")
+            logger.error("Invalid session ID: %s", session_id)
             return False
 
         self.sessions[session_id]["active"] = False
-        logger.info(f"Session ended: {session_id}")
+        logger.info("Session ended: %s", session_id)
         return True
\ No newline at end of file
@@ -1,39 +1,95 @@
 # it_incident_response/system.py
 import logging
-import uuid
 import os
-from typing import Dict, List, Any, Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
 
-from it_incident_response.protocols.a2a import A2AMessage, PartType
+from it_incident_response.protocols.a2a import A2AMessage, A2ATask, next_uuid
 from it_incident_response.protocols.mcp import MCPHost
+from it_incident_response.agents.base import A2AAgent
 from it_incident_response.agents.coordinator import IncidentCoordinatorAgent
 from it_incident_response.agents.diagnostic import DiagnosticAgent
 from it_incident_response.agents.resolution import ResolutionAgent
-from it_incident_response.tools.log_analyzer import LogAnalyzerTool
-from it_incident_response.tools.system_monitor import SystemMonitorTool
-from it_incident_response.tools.knowledge_base import KnowledgeBaseTool
-from it_incident_response.tools.ticketing import TicketingSystemTool
-from it_incident_response.tools.deployment import DeploymentSystemTool
-from it_incident_response.tools.alert import AlertSystemTool
 from it_incident_response.models.incident import (
     load_simulated_incidents, get_incident_by_id, get_all_incidents
 )
 
 logger = logging.getLogger("it-incident-response.system")
 
+# Agent capability names used as request keys, shared by the sync and async paths
+_CREATE_INCIDENT = "create_incident"
+_ANALYZE_INCIDENT = "analyze_incident"
+_IMPLEMENT_RESOLUTION = "implement_resolution"
+_UPDATE_INCIDENT = "update_incident"
+_UPDATE_INCIDENTS = "update_incidents"
+_GET_INCIDENT_STATUS = "get_incident_status"
+_GET_DIAGNOSTIC_REPORT = "get_diagnostic_report"
+_GET_RESOLUTION_STATUS = "get_resolution_status"
+
+# Configuration used when JIRA is not configured; the ticketing tool then simulates JIRA
+_SIMULATED_JIRA: Mapping[str, Any] = MappingProxyType({})
+
+@functools.lru_cache(maxsize=1)
+def _load_jira_config_cached() -> Mapping[str, Any]:
+    """Read the JIRA configuration from the environment once and freeze it"""
+    base_url = os.getenv("JIRA_BASE_URL")
+    username = os.getenv("JIRA_USERNAME")
+    token = os.getenv("JIRA_TOKEN")
+    
+    # Only return config if all required fields are provided
+    if base_url and username and token:
+        return MappingProxyType({
+            "base_url": base_url,
+            "username": username,
+            "token": token,
+            "project_key": os.getenv("JIRA_PROJECT_KEY", "PROJ"),
+            "issue_type": os.getenv("JIRA_ISSUE_TYPE", "Task"),
+            # Remediation steps are always recorded as one comment; set
+            # JIRA_CREATE_SUBTASKS=true to also create a subtask per step
+            "create_subtasks": os.getenv("JIRA_CREATE_SUBTASKS", "").lower() in ("1", "true", "yes"),
+            # Status mapping: incident status -> JIRA workflow transition
+            # Customize this based on your JIRA project's workflow
+            # Run check_jira_transitions.py to see available transitions
+            "status_map": MappingProxyType({
+                "investigating": "In Progress",    # Start investigation
+                "identified": "To Do",              # Move back to backlog if waiting
+                "resolving": "In Progress",         # Resolution is in progress
+                "resolved": "Done",                 # Issue resolved
+                "closed": "Done",                   # Ticket closed
+            })
+        })
+    
+    # If no env vars set, JIRA integration will use simulated mode
+    if any([base_url, username, token]):
+        logger.warning(
+            "Incomplete JIRA configuration detected. Set all of: "
+            "JIRA_BASE_URL, JIRA_USERNAME, JIRA_TOKEN. "
+            "Falling back to simulated JIRA mode."
+        )
+    else:
+        logger.info("JIRA integration not configured (no env vars). Using simulated mode.")
+    
+    return _SIMULATED_JIRA
+
 class IncidentResponseSystem:
     """Main class for the IT Incident Response System"""
 
-    def __init__(self, preload_incidents: bool = True):
+    def __init__(self, preload_incidents: bool = True, minimal: bool = False):
         """
         Initialize the Incident Response System
 
         Args:
             preload_incidents: Whether to preload simulated incidents
+            minimal: Skip the deployment and alert tools, for callers that only
+                create, inspect or list incidents (resolutions cannot be applied
+                and notifications are not sent)
         """
         # Initialize MCP Host
         self.mcp_host = MCPHost()
-        self._register_mcp_tools()
+        self._register_mcp_tools(minimal)
 
         # Initialize Agents
         self.coordinator = IncidentCoordinatorAgent(self.mcp_host)
@@ -46,28 +102,48 @@ class IncidentResponseSystem:
             self.resolution_agent.agent_card.agent_id
         )
 
+        # Runs independent incident pipelines side by side
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        # analyze_incident_async calls still running, keyed by incident ID,
+        # so identical concurrent requests share one analysis
+        self._inflight_analyses: Dict[str, asyncio.Future] = {}
+
         logger.info("IT Incident Response System initialized")
 
         # Preload incidents if requested
         if preload_incidents:
             self.preload_incidents()
 
-    def _register_mcp_tools(self):
-        """Register all MCP tools"""
-        self.mcp_host.register_tool(LogAnalyzerTool())
-        self.mcp_host.register_tool(SystemMonitorTool())
-        self.mcp_host.register_tool(KnowledgeBaseTool())
-        
+    def _register_mcp_tools(self, minimal: bool = False):
+        """Register all MCP tools, importing each tool module only when it is used"""
+        from it_incident_response.tools.log_analyzer import LogAnalyzerTool
+        from it_incident_response.tools.system_monitor import SystemMonitorTool
+        from it_incident_response.tools.knowledge_base import KnowledgeBaseTool
+        from it_incident_response.tools.ticketing import TicketingSystemTool
+
         # Load JIRA configuration from environment variables (optional)
         jira_config = self._load_jira_config()
-        
-        # pass the MCP host to the ticketing tool so it can register related
-        # tools (for example, a per-ticket JIRA integration) at runtime
-        self.mcp_host.register_tool(TicketingSystemTool(self.mcp_host, jira_config=jira_config))
-        self.mcp_host.register_tool(DeploymentSystemTool())
-        self.mcp_host.register_tool(AlertSystemTool())
 
-    def _load_jira_config(self) -> Optional[Dict[str, str]]:
+        # Tools are registered as factories and built on first use
+        factories = {
+            "log-analyzer": LogAnalyzerTool,
+            "system-monitor": SystemMonitorTool,
+            "knowledge-base": KnowledgeBaseTool,
+            # pass the MCP host to the ticketing tool so it can register related
+            # tools (for example, a per-ticket JIRA integration) at runtime
+            "ticketing-system": functools.partial(TicketingSystemTool, self.mcp_host, jira_config=jira_config)
+        }
+
+        if not minimal:
+            from it_incident_response.tools.deployment import DeploymentSystemTool
+            from it_incident_response.tools.alert import AlertSystemTool
+            factories["deployment-system"] = DeploymentSystemTool
+            factories["alert-system"] = AlertSystemTool
+
+        for tool_id, factory in factories.items():
+            self.mcp_host.register_factory(tool_id, factory)
+
+    def _load_jira_config(self) -> Mapping[str, Any]:
         """
         Load JIRA configuration from environment variables.
         
@@ -78,44 +154,20 @@ class IncidentResponseSystem:
             - JIRA_PROJECT_KEY: (Optional) JIRA project key (default: PROJ)
             - JIRA_ISSUE_TYPE: (Optional) Issue type (default: Task)
         
+        The environment is read once per process; call reload_jira_config()
+        after changing it.
+
         Returns:
-            Dictionary with JIRA config if all required env vars are set, None otherwise
+            Read-only JIRA config mapping if all required env vars are set,
+            otherwise an empty mapping (simulated JIRA mode)
         """
-        base_url = os.getenv("JIRA_BASE_URL")
-        username = os.getenv("JIRA_USERNAME")
-        token = os.getenv("JIRA_TOKEN")
-        
-        # Only return config if all required fields are provided
-        if base_url and username and token:
-            return {
-                "base_url": base_url,
-                "username": username,
-                "token": token,
-                "project_key": os.getenv("JIRA_PROJECT_KEY", "PROJ"),
-                "issue_type": os.getenv("JIRA_ISSUE_TYPE", "Task"),
-                # Status mapping: incident status -> JIRA workflow transition
-                # Customize this based on your JIRA project's workflow
-                # Run check_jira_transitions.py to see available transitions
-                "status_map": {
-                    "investigating": "In Progress",    # Start investigation
-                    "identified": "To Do",              # Move back to backlog if waiting
-                    "resolving": "In Progress",         # Resolution is in progress
-                    "resolved": "Done",                 # Issue resolved
-                    "closed": "Done",                   # Ticket closed
-                }
-            }
-        
-        # If no env vars set, JIRA integration will use simulated mode
-        if any([base_url, username, token]):
-            logger.warning(
-                "Incomplete JIRA configuration detected. Set all of: "
-                "JIRA_BASE_URL, JIRA_USERNAME, JIRA_TOKEN. "
-                "Falling back to simulated JIRA mode."
-            )
-        else:
-            logger.info("JIRA integration not configured (no env vars). Using simulated mode.")
-        
-        return None
+        return _load_jira_config_cached()
+
+    @classmethod
+    def reload_jira_config(cls) -> Mapping[str, Any]:
+        """Discard the cached JIRA configuration and read the environment again"""
+        _load_jira_config_cached.cache_clear()
+        return _load_jira_config_cached()
 
     def preload_incidents(self, count: int = 3) -> List[str]:
         """
@@ -127,9 +179,77 @@ class IncidentResponseSystem:
         Returns:
             List of incident IDs
         """
-        logger.info(f"Preloading {count} simulated incidents")
+        logger.info("Preloading %s simulated incidents", count)
         return load_simulated_incidents(count)
 
+    def _start_task(self, agent: A2AAgent, capability: str,
+                    payload: Dict[str, Any]) -> Tuple[A2ATask, A2AMessage]:
+        """Open a task on an agent carrying a single capability request"""
+        message = A2AMessage(
+            message_id=next_uuid(),
+            role="user"
+        )
+        message.add_json_part({capability: payload})
+
+        task_id = agent.create_task(message)
+        return agent.tasks[task_id], message
+
+    @staticmethod
+    def _agent_json(task: A2ATask) -> Dict[str, Any]:
+        """Return the JSON payload of the agent's response to the task"""
+        return task.last_agent_json or {}
+
+    def _call(self, agent: A2AAgent, capability: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to an agent and return its JSON response"""
+        task, message = self._start_task(agent, capability, payload)
+        agent._process_message(task, message)
+        return self._agent_json(task)
+
+    async def _call_async(self, agent: A2AAgent, capability: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request to an agent without blocking the event loop"""
+        task, message = self._start_task(agent, capability, payload)
+        await agent._process_message_async(task, message)
+        return self._agent_json(task)
+
+    def _simple_rpc(self, agent: A2AAgent, capability: str, response_key: str, incident_id: str) -> Dict[str, Any]:
+        """Send a request that only carries an incident ID and return one field of the response"""
+        return self._call(agent, capability, {"incident_id": incident_id}).get(response_key, {})
+
+    async def _simple_rpc_async(self, agent: A2AAgent, capability: str, response_key: str,
+                                incident_id: str) -> Dict[str, Any]:
+        """Async variant of _simple_rpc"""
+        response = await self._call_async(agent, capability, {"incident_id": incident_id})
+        return response.get(response_key, {})
+
+    @staticmethod
+    def _create_request(title: str, description: str, severity: str,
+                        affected_systems: List[str], tags: List[str] = None) -> Dict[str, Any]:
+        """Build the create_incident request payload"""
+        return {
+            "title": title,
+            "description": description,
+            "severity": severity,
+            "affected_systems": affected_systems,
+            "tags": tags or []
+        }
+
+    @staticmethod
+    def _update_request(incident_id: str, status: str, notes: str = None,
+                        remediation_steps: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the update_incident request payload"""
+        request_data = {
+            "incident_id": incident_id,
+            "status": status
+        }
+
+        if notes:
+            request_data["notes"] = notes
+        
+        if remediation_steps:
+            request_data["remediation_steps"] = remediation_steps
+
+        return request_data
+
     def create_incident(self, title: str, description: str, severity: str,
                         affected_systems: List[str], tags: List[str] = None) -> str:
         """
@@ -145,39 +265,16 @@ class IncidentResponseSystem:
         Returns:
             Incident ID
         """
-        # Create a message to the coordinator agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
-
-        # Add JSON part with the create_incident request
-        message.add_json_part({
-            "create_incident": {
-                "title": title,
-                "description": description,
-                "severity": severity,
-                "affected_systems": affected_systems,
-                "tags": tags or []
-            }
-        })
-
-        # Create a task with the coordinator
-        task_id = self.coordinator.create_task(message)
+        response = self._call(self.coordinator, _CREATE_INCIDENT,
+                              self._create_request(title, description, severity, affected_systems, tags))
+        return response.get("incident", {}).get("incident_id")
 
-        # Process the task
-        task = self.coordinator.tasks[task_id]
-        self.coordinator._process_message(task, message)
-
-        # Extract the incident ID from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        incident_data = part.content.get("incident", {})
-                        return incident_data.get("incident_id")
-
-        return None
+    async def create_incident_async(self, title: str, description: str, severity: str,
+                                    affected_systems: List[str], tags: List[str] = None) -> str:
+        """Create a new incident without blocking the event loop (see create_incident)"""
+        response = await self._call_async(self.coordinator, _CREATE_INCIDENT,
+                                          self._create_request(title, description, severity, affected_systems, tags))
+        return response.get("incident", {}).get("incident_id")
 
     def analyze_incident(self, incident_id: str) -> Dict[str, Any]:
         """
@@ -189,34 +286,42 @@ class IncidentResponseSystem:
         Returns:
             Diagnostic report
         """
-        # Create a message to the diagnostic agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
+        return self._simple_rpc(self.diagnostic_agent, _ANALYZE_INCIDENT, "diagnostic_report", incident_id)
 
-        # Add JSON part with the analyze_incident request
-        message.add_json_part({
-            "analyze_incident": {
-                "incident_id": incident_id
-            }
-        })
+    async def analyze_incident_async(self, incident_id: str) -> Dict[str, Any]:
+        """
+        Analyze an incident without blocking the event loop (see analyze_incident)
 
-        # Create a task with the diagnostic agent
-        task_id = self.diagnostic_agent.create_task(message)
+        Concurrent calls for the same incident on the same event loop share a
+        single analysis instead of each running their own.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._inflight_analyses.get(incident_id)
+        if pending is None or pending.get_loop() is not loop:
+            pending = asyncio.ensure_future(
+                self._simple_rpc_async(self.diagnostic_agent, _ANALYZE_INCIDENT, "diagnostic_report", incident_id)
+            )
+            self._inflight_analyses[incident_id] = pending
+            pending.add_done_callback(lambda done: self._forget_analysis(incident_id, done))
+        # Shield the shared analysis so one caller's cancellation doesn't cancel it for the others
+        return await asyncio.shield(pending)
+
+    def _forget_analysis(self, incident_id: str, finished: asyncio.Future) -> None:
+        """Drop a finished analysis so the next request analyzes afresh"""
+        if self._inflight_analyses.get(incident_id) is finished:
+            del self._inflight_analyses[incident_id]
 
-        # Process the task
-        task = self.diagnostic_agent.tasks[task_id]
-        self.diagnostic_agent._process_message(task, message)
+    async def analyze_many(self, incident_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several incidents concurrently
 
-        # Extract the diagnostic report from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("diagnostic_report", {})
+        Args:
+            incident_ids: IDs of the incidents to analyze
 
-        return {}
+        Returns:
+            Diagnostic reports, in the same order as incident_ids
+        """
+        return list(await asyncio.gather(*(self.analyze_incident_async(incident_id) for incident_id in incident_ids)))
 
     def implement_resolution(self, incident_id: str) -> Dict[str, Any]:
         """
@@ -228,34 +333,11 @@ class IncidentResponseSystem:
         Returns:
             Resolution status
         """
-        # Create a message to the resolution agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
-
-        # Add JSON part with the implement_resolution request
-        message.add_json_part({
-            "implement_resolution": {
-                "incident_id": incident_id
-            }
-        })
-
-        # Create a task with the resolution agent
-        task_id = self.resolution_agent.create_task(message)
+        return self._simple_rpc(self.resolution_agent, _IMPLEMENT_RESOLUTION, "resolution_status", incident_id)
 
-        # Process the task
-        task = self.resolution_agent.tasks[task_id]
-        self.resolution_agent._process_message(task, message)
-
-        # Extract the resolution status from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("resolution_status", {})
-
-        return {}
+    async def implement_resolution_async(self, incident_id: str) -> Dict[str, Any]:
+        """Implement a resolution without blocking the event loop (see implement_resolution)"""
+        return await self._simple_rpc_async(self.resolution_agent, _IMPLEMENT_RESOLUTION, "resolution_status", incident_id)
 
     def update_incident_status(self, incident_id: str, status: str, notes: str = None, remediation_steps: List[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -270,43 +352,32 @@ class IncidentResponseSystem:
         Returns:
             Updated incident
         """
-        # Create a message to the coordinator agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
-
-        # Add JSON part with the update_incident request
-        request_data = {
-            "incident_id": incident_id,
-            "status": status
-        }
+        response = self._call(self.coordinator, _UPDATE_INCIDENT,
+                              self._update_request(incident_id, status, notes, remediation_steps))
+        return response.get("incident", {})
+
+    async def update_incident_status_async(self, incident_id: str, status: str, notes: str = None,
+                                           remediation_steps: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Update an incident status without blocking the event loop (see update_incident_status)"""
+        response = await self._call_async(self.coordinator, _UPDATE_INCIDENT,
+                                          self._update_request(incident_id, status, notes, remediation_steps))
+        return response.get("incident", {})
+
+    def update_incident_statuses(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update several incidents with a single coordinator request
 
-        if notes:
-            request_data["notes"] = notes
-        
-        if remediation_steps:
-            request_data["remediation_steps"] = remediation_steps
+        Args:
+            updates: One dict per incident with incident_id and status, plus
+                optional notes and remediation_steps (as for update_incident_status)
 
-        message.add_json_part({
-            "update_incident": request_data
+        Returns:
+            Updated incidents, in the same order as updates ({} where an update failed)
+        """
+        response = self._call(self.coordinator, _UPDATE_INCIDENTS, {
+            "updates": [self._update_request(**update) for update in updates]
         })
-
-        # Create a task with the coordinator
-        task_id = self.coordinator.create_task(message)
-
-        # Process the task
-        task = self.coordinator.tasks[task_id]
-        self.coordinator._process_message(task, message)
-
-        # Extract the updated incident from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("incident", {})
-
-        return {}
+        return response.get("incidents", [])
 
     def get_incident_status(self, incident_id: str) -> Dict[str, Any]:
         """
@@ -318,34 +389,7 @@ class IncidentResponseSystem:
         Returns:
             Incident details
         """
-        # Create a message to the coordinator agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
-
-        # Add JSON part with the get_incident_status request
-        message.add_json_part({
-            "get_incident_status": {
-                "incident_id": incident_id
-            }
-        })
-
-        # Create a task with the coordinator
-        task_id = self.coordinator.create_task(message)
-
-        # Process the task
-        task = self.coordinator.tasks[task_id]
-        self.coordinator._process_message(task, message)
-
-        # Extract the incident from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("incident", {})
-
-        return {}
+        return self._simple_rpc(self.coordinator, _GET_INCIDENT_STATUS, "incident", incident_id)
 
     def get_diagnostic_report(self, incident_id: str) -> Dict[str, Any]:
         """
@@ -357,34 +401,7 @@ class IncidentResponseSystem:
         Returns:
             Diagnostic report
         """
-        # Create a message to the diagnostic agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
-
-        # Add JSON part with the get_diagnostic_report request
-        message.add_json_part({
-            "get_diagnostic_report": {
-                "incident_id": incident_id
-            }
-        })
-
-        # Create a task with the diagnostic agent
-        task_id = self.diagnostic_agent.create_task(message)
-
-        # Process the task
-        task = self.diagnostic_agent.tasks[task_id]
-        self.diagnostic_agent._process_message(task, message)
-
-        # Extract the diagnostic report from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("diagnostic_report", {})
-
-        return {}
+        return self._simple_rpc(self.diagnostic_agent, _GET_DIAGNOSTIC_REPORT, "diagnostic_report", incident_id)
 
     def get_resolution_status(self, incident_id: str) -> Dict[str, Any]:
         """
@@ -396,34 +413,64 @@ class IncidentResponseSystem:
         Returns:
             Resolution status
         """
-        # Create a message to the resolution agent
-        message = A2AMessage(
-            message_id=str(uuid.uuid4()),
-            role="user"
-        )
+        return self._simple_rpc(self.resolution_agent, _GET_RESOLUTION_STATUS, "resolution_status", incident_id)
 
-        # Add JSON part with the get_resolution_status request
-        message.add_json_part({
-            "get_resolution_status": {
-                "incident_id": incident_id
-            }
-        })
+    def run_incident_pipeline(self, title: str, description: str, severity: str,
+                              affected_systems: List[str], tags: List[str] = None) -> Dict[str, Any]:
+        """
+        Take a new incident from creation through diagnosis to resolution
 
-        # Create a task with the resolution agent
-        task_id = self.resolution_agent.create_task(message)
+        Args:
+            title: Incident title
+            description: Incident description
+            severity: Incident severity (low, medium, high, critical)
+            affected_systems: List of affected systems
+            tags: Tags for categorization
 
-        # Process the task
-        task = self.resolution_agent.tasks[task_id]
-        self.resolution_agent._process_message(task, message)
+        Returns:
+            Incident ID, diagnostic report, resolution status and final incident
+        """
+        incident_id = self.create_incident(title, description, severity, affected_systems, tags)
 
-        # Extract the resolution status from the response
-        for msg in task.messages:
-            if msg.role == "agent":
-                for part in msg.parts:
-                    if part.content_type == PartType.JSON:
-                        return part.content.get("resolution_status", {})
+        diagnostic_report = self.analyze_incident(incident_id)
+        self.update_incident_status(
+            incident_id,
+            "identified",
+            notes=f"Root cause identified: {diagnostic_report.get('root_cause')}"
+        )
+        self.update_incident_status(incident_id, "resolving")
+
+        resolution_status = self.implement_resolution(incident_id)
+        actions_taken = resolution_status.get("actions_taken", [])
+        incident = self.update_incident_status(
+            incident_id,
+            "resolved",
+            notes=f"Incident resolved. {len(actions_taken)} remediation actions taken.",
+            remediation_steps=[
+                {"summary": action, "description": f"Action: {action}"}
+                for action in actions_taken
+            ]
+        )
 
-        return {}
+        return {
+            "incident_id": incident_id,
+            "diagnostic_report": diagnostic_report,
+            "resolution_status": resolution_status,
+            "incident": incident
+        }
+
+    def run_incident_pipelines(self, incidents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run the full pipeline for several incidents concurrently
+
+        Args:
+            incidents: Keyword arguments for run_incident_pipeline, one dict per incident
+
+        Returns:
+            Pipeline results, in the same order as incidents
+        """
+        futures = [self._pool.submit(self.run_incident_pipeline, **incident) for incident in incidents]
+        return [future.result() for future in futures]
 
     def list_incidents(self) -> List[Dict[str, Any]]:
         """
@@ -436,8 +483,16 @@ class IncidentResponseSystem:
 
     def cleanup(self):
         """Clean up resources used by the system"""
-        # End agent MCP sessions
-        self.coordinator.cleanup()
-        self.diagnostic_agent.cleanup()
-        self.resolution_agent.cleanup()
+        self._pool.shutdown(wait=True)
+
+        # End agent MCP sessions; each agent first drains its own background
+        # MCP calls, so the agents are cleaned up side by side
+        agents = (self.coordinator, self.diagnostic_agent, self.resolution_agent)
+        with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+            list(executor.map(lambda agent: agent.cleanup(), agents))
+
+        # Stop the ticketing tool's JIRA worker threads, if it was ever built
+        ticketing = self.mcp_host.tools.get("ticketing-system")
+        if ticketing is not None:
+            ticketing.shutdown()
         logger.info("IT Incident Response System cleaned up")
\ No newline at end of file
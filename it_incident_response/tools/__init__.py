@@ -3,14 +3,29 @@ Tool implementations for the IT Incident Response System.
 
 This package contains MCP-compatible tools that provide specialized
 capabilities to agents.
+
+Tool classes are imported from their modules on first access, so using one
+tool does not load the others.
 """
 
-from it_incident_response.tools.log_analyzer import LogAnalyzerTool
-from it_incident_response.tools.system_monitor import SystemMonitorTool
-from it_incident_response.tools.knowledge_base import KnowledgeBaseTool
-from it_incident_response.tools.ticketing import TicketingSystemTool
-from it_incident_response.tools.deployment import DeploymentSystemTool
-from it_incident_response.tools.alert import AlertSystemTool
+import importlib
+
+# Exported tool class -> submodule that defines it
+_TOOL_MODULES = {
+    "LogAnalyzerTool": "log_analyzer",
+    "SystemMonitorTool": "system_monitor",
+    "KnowledgeBaseTool": "knowledge_base",
+    "TicketingSystemTool": "ticketing",
+    "DeploymentSystemTool": "deployment",
+    "AlertSystemTool": "alert"
+}
+
+def __getattr__(name):
+    """Import a tool class from its module the first time it is accessed"""
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
 
 __all__ = [
     "LogAnalyzerTool",
@@ -18,12 +18,14 @@ class AlertSystemTool(MCPTool):
             description="Sends alerts and notifications to IT teams",
             api_endpoint="http://localhost:8001/mcp/alert-system",
             parameters={
-                "action": {"type": "string", "description": "Action to perform (create_alert, acknowledge_alert)"},
+                "action": {"type": "string", "description": "Action to perform (create_alert, create_alerts_bulk, acknowledge_alert)"},
                 "alert_id": {"type": "string", "description": "ID of the alert (for acknowledgements)"},
                 "recipients": {"type": "array", "description": "List of recipients for the alert"},
                 "subject": {"type": "string", "description": "Alert subject"},
                 "message": {"type": "string", "description": "Alert message content"},
-                "severity": {"type": "string", "description": "Alert severity", "default": "medium"}
+                "severity": {"type": "string", "description": "Alert severity", "default": "medium"},
+                "notes": {"type": "string", "description": "Optional notes sent alongside the message"},
+                "alerts": {"type": "array", "description": "List of alerts to create (for create_alerts_bulk)"}
             }
         )
         # Store alerts for simulation
@@ -40,6 +42,11 @@ class AlertSystemTool(MCPTool):
 
         if action == "create_alert":
             return self._create_alert(params)
+        elif action == "create_alerts_bulk":
+            alerts = params.get("alerts")
+            if alerts is None:
+                return {"status": "error", "message": "Missing required parameter: alerts"}
+            return self._create_alerts_bulk(alerts)
         elif action == "acknowledge_alert":
             alert_id = params.get("alert_id")
             if not alert_id:
@@ -69,9 +76,11 @@ class AlertSystemTool(MCPTool):
             "status": "sent",
             "acknowledged": False
         }
+        if params.get("notes"):
+            alert["notes"] = params["notes"]
 
         self.alerts[alert_id] = alert
-        logger.info(f"Alert created: {alert_id} - {alert['subject']}")
+        logger.info("Alert created: %s - %s", alert_id, alert['subject'])
 
         return {
             "status": "success",
@@ -81,6 +90,34 @@ class AlertSystemTool(MCPTool):
             }
         }
 
+    def _create_alerts_bulk(self, alerts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create several alerts in a single call"""
+        alert_ids = []
+        errors = []
+        for alert_params in alerts:
+            result = self._create_alert(alert_params)
+            if result.get("status") == "success":
+                alert_ids.append(result["data"]["alert_id"])
+            else:
+                errors.append(result.get("message"))
+
+        if errors:
+            return {
+                "status": "error",
+                "message": f"{len(errors)} of {len(alerts)} alerts could not be created",
+                "data": {
+                    "alert_ids": alert_ids,
+                    "errors": errors
+                }
+            }
+
+        return {
+            "status": "success",
+            "data": {
+                "alert_ids": alert_ids
+            }
+        }
+
     def _acknowledge_alert(self, alert_id: str, acknowledger: str = None) -> Dict[str, Any]:
         """Acknowledge an existing alert"""
         if alert_id not in self.alerts:
@@ -94,7 +131,7 @@ class AlertSystemTool(MCPTool):
         if acknowledger:
             alert["acknowledged_by"] = acknowledger
 
-        logger.info(f"Alert acknowledged: {alert_id}")
+        logger.info("Alert acknowledged: %s", alert_id)
 
         return {
             "status": "success",
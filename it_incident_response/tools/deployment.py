@@ -93,7 +93,7 @@ class DeploymentSystemTool(MCPTool):
         }
         self.deployment_history.append(operation)
 
-        logger.info(f"Configuration updated for {target}: {parameters}")
+        logger.info("Configuration updated for %s: %s", target, parameters)
 
         return {
             "status": "success",
@@ -118,7 +118,7 @@ class DeploymentSystemTool(MCPTool):
         }
         self.deployment_history.append(operation)
 
-        logger.info(f"Service restarted: {target}")
+        logger.info("Service restarted: %s", target)
 
         return {
             "status": "success",
@@ -146,7 +146,7 @@ class DeploymentSystemTool(MCPTool):
         }
         self.deployment_history.append(operation)
 
-        logger.info(f"Patch deployed to {target}: version {patch_version}")
+        logger.info("Patch deployed to %s: version %s", target, patch_version)
 
         return {
             "status": "success",
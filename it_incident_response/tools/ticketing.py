@@ -1,12 +1,91 @@
 import datetime
+import functools
+import hashlib
+import importlib.util
 import logging
+import secrets
+import threading
 import uuid
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
 
 from it_incident_response.protocols.mcp import MCPTool, MCPToolType
 
 logger = logging.getLogger("it-incident-response.tools.ticketing")
 
+# Shared stand-in when no JIRA configuration is given (simulated mode)
+_NO_JIRA_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Incident status -> JIRA transition when the config has no status_map
+_DEFAULT_STATUS_MAP: Mapping[str, str] = MappingProxyType({
+    "investigating": "In Progress",
+    "identified": "To Do",
+    "resolving": "In Progress",
+    "resolved": "Done",
+    "closed": "Done",
+})
+
+# Whether the optional jira package is installed, looked up once at import
+_JIRA_AVAILABLE = importlib.util.find_spec("jira") is not None
+
+# JIRA client class, imported on first use so simulated runs never load jira
+_JIRA_CLASS = None
+
+# JIRA clients shared by every JIRATool, keyed by (base_url, username,
+# token digest), so all tickets reuse one connection pool per account
+_shared_jira_clients: Dict[Tuple[str, str, str], Any] = {}
+_shared_jira_lock = threading.Lock()
+
+# Connection pool sizing and retry policy for the shared clients
+_JIRA_POOL_CONNECTIONS = 20
+_JIRA_POOL_MAXSIZE = 50
+_JIRA_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Most issues JIRA creates in one /issue/bulk request
+_JIRA_BULK_CREATE_LIMIT = 50
+
+
+def _get_jira_class():
+    """Import the JIRA client class once and reuse it afterwards"""
+    global _JIRA_CLASS
+    if _JIRA_CLASS is None:
+        from jira import JIRA
+        _JIRA_CLASS = JIRA
+    return _JIRA_CLASS
+
+
+def _get_shared_jira_client(jira_config: Mapping[str, Any]):
+    """Return the process-wide JIRA client for a config, creating it on first use"""
+    base_url = jira_config.get("base_url")
+    username = jira_config.get("username")
+    token = jira_config.get("token")
+    if not (_JIRA_AVAILABLE and base_url and username and token):
+        return None
+
+    key = (base_url, username, hashlib.sha256(token.encode()).hexdigest())
+    with _shared_jira_lock:
+        client = _shared_jira_clients.get(key)
+        if client is None:
+            # A new token replaces the account's client built with the old one
+            for stale_key in [k for k in _shared_jira_clients if k[:2] == key[:2]]:
+                del _shared_jira_clients[stale_key]
+            JIRA = _get_jira_class()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            client = JIRA(options={"server": base_url}, basic_auth=(username, token))
+            adapter = HTTPAdapter(
+                pool_connections=_JIRA_POOL_CONNECTIONS,
+                pool_maxsize=_JIRA_POOL_MAXSIZE,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=_JIRA_RETRY_STATUSES)
+            )
+            client._session.mount("https://", adapter)
+            client._session.mount("http://", adapter)
+            _shared_jira_clients[key] = client
+            logger.info("Shared JIRA client created for %s at %s", username, base_url)
+        return client
+
 
 class JIRATool:
     """Represents a (simulated) JIRA integration registered per-ticket.
@@ -17,191 +96,306 @@ class JIRATool:
     when JIRA is not available or an error occurs.
     """
 
-    def __init__(self, ticket_id: str, summary: str = "", description: str = "", jira_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, ticket_id: str, summary: str = "", description: str = "", jira_config: Optional[Mapping[str, Any]] = None):
         self.ticket_id = ticket_id
         self.summary = summary
         self.description = description
-        self.jira_config = jira_config or {}
+        self.jira_config = jira_config if jira_config is not None else _NO_JIRA_CONFIG
+        self._read_issue_settings()
         self.issue_key: Optional[str] = None
         self._cached_transitions: Optional[List[Dict[str, Any]]] = None
+        # issue_key -> index of lowercased transition names and ids to
+        # (id, name), reused until that issue is transitioned
+        self._transition_index: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "create_issue": self._handle_create_issue,
+            "get_issue": self._handle_get_issue,
+            "get_transitions": self._handle_get_transitions,
+            "add_comment": self._handle_add_comment,
+            "transition_issue": self._handle_transition_issue,
+            "create_subtask": self._handle_create_subtask,
+            "bulk_create_subtasks": self._handle_bulk_create_subtasks,
+            "add_attachment": self._handle_add_attachment,
+            "add_worklog": self._handle_add_worklog
+        }
+        # The shared client (or its absence) is resolved once per ticket
+        self._jira_client = None
+        self._jira_client_checked = False
+
+    def _read_issue_settings(self) -> None:
+        """Pull the settings used for every new issue out of the config once"""
+        self._project_key = self.jira_config.get("project_key", "PROJ")
+        self._issue_type = self.jira_config.get("issue_type", "Task")
+        self._base_url = (self.jira_config.get("base_url") or "").rstrip("/")
+
+    def set_jira_config(self, jira_config: Optional[Mapping[str, Any]]) -> None:
+        """Switch to a new JIRA configuration, dropping the resolved client"""
+        self.jira_config = jira_config if jira_config is not None else _NO_JIRA_CONFIG
+        self._read_issue_settings()
+        self._jira_client = None
+        self._jira_client_checked = False
+        self._cached_transitions = None
+        self._transition_index = {}
 
     def _get_jira_client(self):
         """Return a JIRA client if available, otherwise None"""
+        if self._jira_client_checked:
+            return self._jira_client
         try:
-            import importlib.util
-            if importlib.util.find_spec("jira") is None:
-                return None
-            from jira import JIRA
-            if not (self.jira_config.get("base_url") and self.jira_config.get("username") and self.jira_config.get("token")):
-                return None
-            jira_opts = {"server": self.jira_config.get("base_url")}
-            return JIRA(options=jira_opts, basic_auth=(self.jira_config.get("username"), self.jira_config.get("token")))
+            client = _get_shared_jira_client(self.jira_config)
         except Exception as e:
-            logger.debug(f"JIRA client not available: {e}")
+            # Left unresolved so the next call tries again
+            logger.warning("JIRA client not available: %s", e)
             return None
+        # None here means the package or credentials are missing, which is
+        # cached too so simulated mode skips setup entirely
+        self._jira_client = client
+        self._jira_client_checked = True
+        return client
+
+    @staticmethod
+    def _index_transitions(transitions: List[Dict[str, Any]]) -> Dict[str, Tuple[Any, Any]]:
+        """Map lowercased transition names and ids to (id, name)"""
+        index: Dict[str, Tuple[Any, Any]] = {}
+        # Later entries must not shadow earlier ones so the first match wins
+        for t in transitions:
+            entry = (t.get("id"), t.get("name"))
+            index.setdefault(str(t.get("name", "")).lower(), entry)
+            index.setdefault(str(t.get("id", "")), entry)
+        return index
+
+    def _cache_transitions(self, issue_key: str, transitions: List[Dict[str, Any]]) -> Dict[str, Tuple[Any, Any]]:
+        """Remember an issue's transitions and return their index"""
+        # Only id and name are ever used, so the rest of the payload is dropped
+        transitions = [{"id": t.get("id"), "name": t.get("name")} for t in transitions]
+        if issue_key == self.issue_key:
+            self._cached_transitions = transitions
+        index = self._index_transitions(transitions)
+        self._transition_index[issue_key] = index
+        return index
+
+    def _forget_transitions(self, issue_key: str) -> None:
+        """Drop an issue's remembered transitions so the next lookup fetches them"""
+        self._transition_index.pop(issue_key, None)
+        if issue_key == self.issue_key:
+            self._cached_transitions = None
 
     def execute(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         params = params or {}
         action = params.get("action")
 
-        if action == "create_issue":
-            # Try to create a real JIRA issue if possible, else simulate
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    issue_dict = {
-                        "project": {"key": self.jira_config.get("project_key", "PROJ")},
-                        "summary": self.summary or params.get("data", {}).get("summary", "Automated issue"),
-                        "description": self.description or params.get("data", {}).get("description", "Created from incident response system"),
-                        "issuetype": {"name": self.jira_config.get("issue_type", "Task")},
-                    }
-                    issue = jira_client.create_issue(fields=issue_dict)
-                    self.issue_key = getattr(issue, "key", None)
-                    issue_url = None
-                    if self.issue_key and self.jira_config.get("base_url"):
-                        issue_url = f"{self.jira_config['base_url'].rstrip('/')}/browse/{self.issue_key}"
-                    return {"status": "success", "data": {"issue_key": self.issue_key, "issue_url": issue_url}}
-                except Exception as e:
-                    logger.exception(f"JIRA issue creation failed for ticket {self.ticket_id}: {e}")
-
-            # Simulated issue key and URL
-            simulated_key = f"SIM-{str(uuid.uuid4())[:8].upper()}"
-            self.issue_key = simulated_key
-            issue_url = None
-            if self.jira_config.get("base_url"):
-                issue_url = f"{self.jira_config['base_url'].rstrip('/')}/browse/{simulated_key}"
-            return {"status": "success", "data": {"issue_key": simulated_key, "issue_url": issue_url}}
-
-        if action == "get_issue":
-            if not self.issue_key:
-                return {"status": "error", "message": "No issue created for this tool yet"}
-            return {"status": "success", "data": {"issue_key": self.issue_key}}
-
-        if action == "get_transitions":
-            jira_client = self._get_jira_client()
-            if jira_client and self.issue_key:
-                try:
-                    transitions = jira_client.transitions(self.issue_key)
-                    self._cached_transitions = transitions
-                    return {"status": "success", "data": {"transitions": transitions}}
-                except Exception as e:
-                    logger.debug(f"Failed to list transitions for {self.issue_key}: {e}")
-            return {"status": "success", "data": {"transitions": []}}
-
-        if action == "add_comment":
-            issue_key = params.get("data", {}).get("issue_key") or self.issue_key
-            comment = params.get("data", {}).get("comment")
-            if not issue_key or not comment:
-                return {"status": "error", "message": "issue_key and comment required"}
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    jira_client.add_comment(issue_key, comment)
-                    return {"status": "success"}
-                except Exception as e:
-                    logger.exception(f"Failed to add comment to {issue_key}: {e}")
-            # simulated success
-            return {"status": "success"}
-
-        if action == "transition_issue":
-            issue_key = params.get("data", {}).get("issue_key") or self.issue_key
-            transition = params.get("data", {}).get("transition")
-            if not issue_key or not transition:
-                return {"status": "error", "message": "issue_key and transition required"}
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    transitions = jira_client.transitions(issue_key)
-                    transition_id = None
-                    matched_transition = None
-                    
-                    # Try to find matching transition by name or ID
-                    for t in transitions:
-                        t_name = str(t.get("name", "")).lower()
-                        t_id = str(t.get("id", ""))
-                        
-                        if t_name == str(transition).lower() or t_id == str(transition):
-                            transition_id = t.get("id")
-                            matched_transition = t.get("name")
-                            break
-                    
-                    if not transition_id:
-                        available = [t.get("name") for t in transitions]
-                        logger.warning(f"Transition '{transition}' not found for {issue_key}. Available: {available}")
-                        return {"status": "error", "message": f"Transition '{transition}' not found. Available: {available}"}
-                    
-                    jira_client.transition_issue(issue_key, transition=transition_id)
-                    logger.info(f"✓ Transitioned {issue_key} to '{matched_transition}' (ID: {transition_id})")
-                    return {"status": "success", "data": {"transition": matched_transition, "issue_key": issue_key}}
-                except Exception as e:
-                    logger.exception(f"Failed to transition {issue_key} -> {transition}: {e}")
-                    return {"status": "error", "message": str(e)}
-            # simulated success
-            logger.debug(f"[SIMULATED] Transitioning {issue_key} to '{transition}'")
-            return {"status": "success", "data": {"transition": transition, "issue_key": issue_key, "simulated": True}}
-
-        if action == "create_subtask":
-            data = params.get("data", {})
-            parent_key = data.get("parent_key")
-            summary = data.get("summary")
-            issuetype = data.get("issuetype", "Sub-task")
-            if not parent_key or not summary:
-                return {"status": "error", "message": "parent_key and summary required"}
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    issue_dict = {
+        handler = self._handlers.get(action)
+        if handler is None:
+            return {"status": "error", "message": f"Unsupported action: {action}"}
+        return handler(params)
+
+    def _handle_create_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the JIRA issue for this ticket, or simulate one"""
+        # Try to create a real JIRA issue if possible, else simulate
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                issue_dict = {
+                    "project": {"key": self._project_key},
+                    "summary": self.summary or params.get("data", {}).get("summary", "Automated issue"),
+                    "description": self.description or params.get("data", {}).get("description", "Created from incident response system"),
+                    "issuetype": {"name": self._issue_type},
+                }
+                issue = jira_client.create_issue(fields=issue_dict)
+                self.issue_key = getattr(issue, "key", None)
+                issue_url = None
+                if self.issue_key and self._base_url:
+                    issue_url = f"{self._base_url}/browse/{self.issue_key}"
+                return {"status": "success", "data": {"issue_key": self.issue_key, "issue_url": issue_url}}
+            except Exception as e:
+                logger.exception("JIRA issue creation failed for ticket %s: %s", self.ticket_id, e)
+
+        # Simulated issue key and URL
+        simulated_key = f"SIM-{secrets.token_hex(4).upper()}"
+        self.issue_key = simulated_key
+        issue_url = None
+        if self._base_url:
+            issue_url = f"{self._base_url}/browse/{simulated_key}"
+        return {"status": "success", "data": {"issue_key": simulated_key, "issue_url": issue_url}}
+
+    def _handle_get_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the key of this ticket's JIRA issue"""
+        if not self.issue_key:
+            return {"status": "error", "message": "No issue created for this tool yet"}
+        return {"status": "success", "data": {"issue_key": self.issue_key}}
+
+    def _handle_get_transitions(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """List the transitions available on this ticket's issue (id and name only)"""
+        jira_client = self._get_jira_client()
+        if jira_client and self.issue_key:
+            try:
+                self._cache_transitions(self.issue_key, jira_client.transitions(self.issue_key))
+                return {"status": "success", "data": {"transitions": self._cached_transitions}}
+            except Exception as e:
+                logger.debug("Failed to list transitions for %s: %s", self.issue_key, e)
+        return {"status": "success", "data": {"transitions": []}}
+
+    def _handle_add_comment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a comment to an issue"""
+        issue_key = params.get("data", {}).get("issue_key") or self.issue_key
+        comment = params.get("data", {}).get("comment")
+        if not issue_key or not comment:
+            return {"status": "error", "message": "issue_key and comment required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                jira_client.add_comment(issue_key, comment)
+                return {"status": "success"}
+            except Exception as e:
+                logger.exception("Failed to add comment to %s: %s", issue_key, e)
+        # simulated success
+        return {"status": "success"}
+
+    def _handle_transition_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Move an issue through a workflow transition"""
+        issue_key = params.get("data", {}).get("issue_key") or self.issue_key
+        transition = params.get("data", {}).get("transition")
+        if not issue_key or not transition:
+            return {"status": "error", "message": "issue_key and transition required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                # Reuse the transitions already fetched for this issue
+                index = self._transition_index.get(issue_key)
+                if index is None:
+                    index = self._cache_transitions(issue_key, jira_client.transitions(issue_key))
+
+                # Find matching transition by name or ID
+                transition_id, matched_transition = index.get(str(transition).lower()) or index.get(str(transition)) or (None, None)
+
+                if not transition_id:
+                    available = list(dict.fromkeys(name for _, name in index.values()))
+                    # The issue may have moved in JIRA; fetch afresh next time
+                    self._forget_transitions(issue_key)
+                    logger.warning("Transition '%s' not found for %s. Available: %s", transition, issue_key, available)
+                    return {"status": "error", "message": f"Transition '{transition}' not found. Available: {available}"}
+
+                jira_client.transition_issue(issue_key, transition=transition_id)
+                # Available transitions change with the issue's state
+                self._forget_transitions(issue_key)
+                logger.info("✓ Transitioned %s to '%s' (ID: %s)", issue_key, matched_transition, transition_id)
+                return {"status": "success", "data": {"transition": matched_transition, "issue_key": issue_key}}
+            except Exception as e:
+                self._forget_transitions(issue_key)
+                logger.exception("Failed to transition %s -> %s: %s", issue_key, transition, e)
+                return {"status": "error", "message": str(e)}
+        # simulated success
+        logger.debug("[SIMULATED] Transitioning %s to '%s'", issue_key, transition)
+        return {"status": "success", "data": {"transition": transition, "issue_key": issue_key, "simulated": True}}
+
+    def _handle_create_subtask(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a subtask under a parent issue"""
+        data = params.get("data", {})
+        parent_key = data.get("parent_key")
+        summary = data.get("summary")
+        issuetype = data.get("issuetype", "Sub-task")
+        if not parent_key or not summary:
+            return {"status": "error", "message": "parent_key and summary required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                issue_dict = {
+                    "project": {"key": self.jira_config.get("project_key")},
+                    "summary": summary,
+                    "issuetype": {"name": issuetype},
+                    "parent": {"key": parent_key}
+                }
+                sub = jira_client.create_issue(fields=issue_dict)
+                sub_key = getattr(sub, "key", None)
+                return {"status": "success", "data": {"subtask_key": sub_key}}
+            except Exception as e:
+                logger.exception("Failed to create subtask for %s: %s", parent_key, e)
+        sub_key = f"SIM-SUB-{secrets.token_hex(4).upper()}"
+        return {"status": "success", "data": {"subtask_key": sub_key}}
+
+    def _handle_bulk_create_subtasks(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create several subtasks under a parent issue in bulk"""
+        data = params.get("data", {})
+        parent_key = data.get("parent_key")
+        summaries = data.get("summaries")
+        issuetype = data.get("issuetype", "Sub-task")
+        if not parent_key or not summaries:
+            return {"status": "error", "message": "parent_key and summaries required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                field_list = [
+                    {
                         "project": {"key": self.jira_config.get("project_key")},
                         "summary": summary,
                         "issuetype": {"name": issuetype},
                         "parent": {"key": parent_key}
                     }
-                    sub = jira_client.create_issue(fields=issue_dict)
-                    sub_key = getattr(sub, "key", None)
-                    return {"status": "success", "data": {"subtask_key": sub_key}}
-                except Exception as e:
-                    logger.exception(f"Failed to create subtask for {parent_key}: {e}")
-            sub_key = f"SIM-SUB-{str(uuid.uuid4())[:8].upper()}"
-            return {"status": "success", "data": {"subtask_key": sub_key}}
-
-        if action == "add_attachment":
-            data = params.get("data", {})
-            issue_key = data.get("issue_key") or self.issue_key
-            file_path = data.get("file_path")
-            if not issue_key or not file_path:
-                return {"status": "error", "message": "issue_key and file_path required"}
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    jira_client.add_attachment(issue=issue_key, attachment=file_path)
-                    return {"status": "success"}
-                except Exception as e:
-                    logger.exception(f"Failed to add attachment to {issue_key}: {e}")
-            return {"status": "success"}
-
-        if action == "add_worklog":
-            data = params.get("data", {})
-            issue_key = data.get("issue_key") or self.issue_key
-            time_spent = data.get("time_spent_seconds")
-            comment = data.get("comment")
-            if not issue_key or not time_spent:
-                return {"status": "error", "message": "issue_key and time_spent_seconds required"}
-            jira_client = self._get_jira_client()
-            if jira_client:
-                try:
-                    jira_client.add_worklog(issue_key, time_spent_seconds=time_spent, comment=comment)
-                    return {"status": "success"}
-                except Exception as e:
-                    logger.exception(f"Failed to add worklog to {issue_key}: {e}")
-            return {"status": "success"}
-
-        return {"status": "error", "message": f"Unsupported action: {action}"}
+                    for summary in summaries
+                ]
+                subtask_keys = []
+                errors = []
+                failed_summaries = []
+                # The bulk endpoint accepts a limited number of issues per request
+                for start in range(0, len(field_list), _JIRA_BULK_CREATE_LIMIT):
+                    batch = field_list[start:start + _JIRA_BULK_CREATE_LIMIT]
+                    for fields, result in zip(batch, jira_client.create_issues(field_list=batch, prefetch=False)):
+                        if result.get("issue") is not None:
+                            subtask_keys.append(getattr(result["issue"], "key", None))
+                        else:
+                            errors.append(result.get("error"))
+                            failed_summaries.append(fields["summary"])
+                if errors:
+                    return {
+                        "status": "error",
+                        "message": f"{len(errors)} of {len(summaries)} subtasks could not be created",
+                        "data": {"subtask_keys": subtask_keys, "errors": errors, "failed_summaries": failed_summaries}
+                    }
+                return {"status": "success", "data": {"subtask_keys": subtask_keys}}
+            except Exception as e:
+                logger.exception("Failed to bulk create subtasks for %s: %s", parent_key, e)
+                return {"status": "error", "message": str(e)}
+        subtask_keys = [f"SIM-SUB-{secrets.token_hex(4).upper()}" for _ in summaries]
+        return {"status": "success", "data": {"subtask_keys": subtask_keys}}
+
+    def _handle_add_attachment(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach a file to an issue"""
+        data = params.get("data", {})
+        issue_key = data.get("issue_key") or self.issue_key
+        file_path = data.get("file_path")
+        if not issue_key or not file_path:
+            return {"status": "error", "message": "issue_key and file_path required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                jira_client.add_attachment(issue=issue_key, attachment=file_path)
+                return {"status": "success"}
+            except Exception as e:
+                logger.exception("Failed to add attachment to %s: %s", issue_key, e)
+        return {"status": "success"}
+
+    def _handle_add_worklog(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Log time spent on an issue"""
+        data = params.get("data", {})
+        issue_key = data.get("issue_key") or self.issue_key
+        time_spent = data.get("time_spent_seconds")
+        comment = data.get("comment")
+        if not issue_key or not time_spent:
+            return {"status": "error", "message": "issue_key and time_spent_seconds required"}
+        jira_client = self._get_jira_client()
+        if jira_client:
+            try:
+                jira_client.add_worklog(issue_key, time_spent_seconds=time_spent, comment=comment)
+                return {"status": "success"}
+            except Exception as e:
+                logger.exception("Failed to add worklog to %s: %s", issue_key, e)
+        return {"status": "success"}
 
 
 class TicketingSystemTool(MCPTool):
     """Ticketing System tool implementation (simulated)"""
 
-    def __init__(self, mcp_host: Optional[Any] = None, jira_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, mcp_host: Optional[Any] = None, jira_config: Optional[Mapping[str, Any]] = None):
         super().__init__(
             tool_id="ticketing-system",
             tool_type=MCPToolType.TICKETING_SYSTEM,
@@ -219,9 +413,25 @@ class TicketingSystemTool(MCPTool):
         # Optional MCP host so this tool can register related tools (like JIRA)
         self.mcp_host = mcp_host
         # Optional JIRA configuration for real integration
-        self.jira_config = jira_config or {}
+        self.jira_config = jira_config if jira_config is not None else _NO_JIRA_CONFIG
+        # Status map from config, with fallback to defaults
+        self._status_map: Mapping[str, str] = self.jira_config.get("status_map", _DEFAULT_STATUS_MAP)
         # Keep per-ticket jira tools for executing lifecycle actions
         self._jira_tools: Dict[str, JIRATool] = {}
+        # Runs independent JIRA writes of one update concurrently
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "create_ticket": self._handle_create_ticket,
+            "update_ticket": self._handle_update_ticket,
+            "get_ticket": self._handle_get_ticket
+        }
+
+    def set_jira_config(self, jira_config: Optional[Mapping[str, Any]]) -> None:
+        """Switch this tool and its per-ticket JIRA tools to a new JIRA configuration"""
+        self.jira_config = jira_config if jira_config is not None else _NO_JIRA_CONFIG
+        self._status_map = self.jira_config.get("status_map", _DEFAULT_STATUS_MAP)
+        for jira_tool in list(self._jira_tools.values()):
+            jira_tool.set_jira_config(self.jira_config)
 
     def execute(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         if not params:
@@ -230,35 +440,51 @@ class TicketingSystemTool(MCPTool):
         if not action:
             return {"status": "error", "message": "Missing required parameter: action"}
 
-        if action == "create_ticket":
-            return self._create_ticket(params.get("data", {}))
-        if action == "update_ticket":
-            ticket_id = params.get("ticket_id")
-            if not ticket_id:
-                return {"status": "error", "message": "Missing required parameter: ticket_id"}
-            return self._update_ticket(ticket_id, params.get("data", {}))
-        if action == "get_ticket":
-            ticket_id = params.get("ticket_id")
-            if not ticket_id:
-                return {"status": "error", "message": "Missing required parameter: ticket_id"}
-            return self._get_ticket(ticket_id)
-        return {"status": "error", "message": f"Unsupported action: {action}"}
+        handler = self._handlers.get(action)
+        if handler is None:
+            return {"status": "error", "message": f"Unsupported action: {action}"}
+        return handler(params)
+
+    def _handle_create_ticket(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a ticket from the request data"""
+        return self._create_ticket(params.get("data", {}))
+
+    def _handle_update_ticket(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Update an existing ticket from the request data"""
+        ticket_id = params.get("ticket_id")
+        if not ticket_id:
+            return {"status": "error", "message": "Missing required parameter: ticket_id"}
+        return self._update_ticket(ticket_id, params.get("data", {}))
+
+    def _handle_get_ticket(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return an existing ticket"""
+        ticket_id = params.get("ticket_id")
+        if not ticket_id:
+            return {"status": "error", "message": "Missing required parameter: ticket_id"}
+        return self._get_ticket(ticket_id)
+
+    def shutdown(self) -> None:
+        """Finish pending JIRA writes and stop this tool's worker threads"""
+        self._executor.shutdown(wait=True)
 
     def _create_ticket(self, data: Dict[str, Any]) -> Dict[str, Any]:
         if not data:
             return {"status": "error", "message": "Empty ticket data"}
 
         ticket_id = data.get("incident_id") or str(uuid.uuid4())
-        ticket = data.copy()
-        ticket.update({
+        # A new ticket's created and updated times are the same instant
+        now_iso = datetime.datetime.now().isoformat()
+        # Build the ticket in one step; the ticket's own fields win over data
+        ticket = {
+            **data,
             "ticket_id": ticket_id,
-            "created_at": datetime.datetime.now().isoformat(),
-            "updated_at": datetime.datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "status": data.get("status", "open")
-        })
+        }
 
         self.tickets[ticket_id] = ticket
-        logger.info(f"Ticket created: {ticket_id}")
+        logger.info("Ticket created: %s", ticket_id)
 
         # Register per-ticket JIRA tool and attempt to create an issue
         if self.mcp_host:
@@ -282,15 +508,15 @@ class TicketingSystemTool(MCPTool):
                     if issue_url:
                         ticket["jira_issue_url"] = issue_url
             except Exception as e:
-                logger.warning(f"Failed to register/create JIRA tool for ticket {ticket_id}: {e}")
+                logger.warning("Failed to register/create JIRA tool for ticket %s: %s", ticket_id, e)
 
         return {"status": "success", "data": {"ticket_id": ticket_id, "ticket": ticket}}
 
     def _update_ticket(self, ticket_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        if ticket_id not in self.tickets:
+        ticket = self.tickets.get(ticket_id)
+        if ticket is None:
             return {"status": "error", "message": f"Ticket not found: {ticket_id}"}
 
-        ticket = self.tickets[ticket_id]
         # Detect status changes, notes, attachments, remediation steps
         status = data.get("status")
         notes = data.get("notes")
@@ -301,103 +527,159 @@ class TicketingSystemTool(MCPTool):
         ticket.update(data)
         ticket["updated_at"] = datetime.datetime.now().isoformat()
 
-        jira_tool = self._jira_tools.get(ticket_id)
+        # Only status, notes, attachments and remediation steps reach JIRA;
+        # any other change is a local-only update
+        if status or notes or attachments or remediation_steps:
+            jira_tool = self._jira_tools.get(ticket_id)
+            if jira_tool:
+                self._sync_jira_issue(ticket_id, ticket, jira_tool, status, notes, attachments, remediation_steps)
+
+        logger.info("✓ Ticket updated: %s", ticket_id)
+        return {"status": "success", "data": {"ticket_id": ticket_id, "ticket": ticket}}
+
+    def _sync_jira_issue(self, ticket_id: str, ticket: Dict[str, Any], jira_tool: JIRATool, status: Optional[str], notes: Any,
+                         attachments: Optional[List[str]], remediation_steps: Optional[List[Dict[str, Any]]]) -> None:
+        """Mirror a ticket update onto its JIRA issue"""
+        # Independent JIRA writes are collected here and run concurrently;
+        # writes that depend on each other stay together in one job
+        jobs: List[Callable[[], None]] = []
 
         # Best-effort: transition JIRA issue when status changes
-        if jira_tool and status:
-            # Use status map from config, with fallback to defaults
-            status_map = self.jira_config.get("status_map", {
-                "investigating": "In Progress",
-                "identified": "To Do",
-                "resolving": "In Progress",
-                "resolved": "Done",
-                "closed": "Done",
-            })
-            target_transition = status_map.get(status, status)
+        if status:
+            target_transition = self._status_map.get(status, status)
             
             # Ensure we have an issue key to operate on
             issue_key = ticket.get("jira_issue_key") or jira_tool.issue_key
             if issue_key and target_transition:
-                logger.info(f"📋 Updating JIRA issue {issue_key}: incident status changed to '{status}' → transition to '{target_transition}'")
-                try:
-                    trans_result = jira_tool.execute({
-                        "action": "transition_issue", 
-                        "data": {"issue_key": issue_key, "transition": target_transition}
-                    })
-                    if trans_result.get("status") == "success":
-                        logger.info(f"✓ JIRA transition successful for {issue_key}")
-                    else:
-                        logger.warning(f"⚠ JIRA transition failed: {trans_result.get('message', 'Unknown error')}")
-                    
-                    # add a comment about the transition
-                    jira_tool.execute({
-                        "action": "add_comment", 
-                        "data": {"issue_key": issue_key, "comment": f"Incident status changed to: {status}"}
-                    })
-                except Exception as e:
-                    logger.warning(f"⚠ Failed to update JIRA issue for ticket {ticket_id}: {e}")
+                jobs.append(functools.partial(self._jira_transition, jira_tool, ticket_id, issue_key, status, target_transition))
             elif not issue_key:
-                logger.warning(f"⚠ No JIRA issue key found for ticket {ticket_id}")
+                logger.warning("⚠ No JIRA issue key found for ticket %s", ticket_id)
             elif not target_transition:
-                logger.warning(f"⚠ No JIRA transition mapped for incident status '{status}'")
+                logger.warning("⚠ No JIRA transition mapped for incident status '%s'", status)
 
         # Add notes as JIRA comments
-        if jira_tool and notes:
+        if notes:
             # notes can be a single string or list
             note_list = notes if isinstance(notes, list) else [notes]
             issue_key = ticket.get("jira_issue_key") or jira_tool.issue_key
             if issue_key:
-                logger.info(f"📝 Adding {len(note_list)} note(s) to JIRA issue {issue_key}")
-                for n in note_list:
-                    try:
-                        jira_tool.execute({"action": "add_comment", "data": {"issue_key": issue_key, "comment": n}})
-                    except Exception as e:
-                        logger.warning(f"⚠ Failed to add comment to JIRA for ticket {ticket_id}: {e}")
+                # Notes are posted in order, so they share one job
+                jobs.append(functools.partial(self._jira_notes, jira_tool, ticket_id, issue_key, note_list))
 
         # Add attachments
-        if jira_tool and attachments:
+        if attachments:
             issue_key = ticket.get("jira_issue_key") or jira_tool.issue_key
             if issue_key:
-                logger.info(f"📎 Adding {len(attachments)} attachment(s) to JIRA issue {issue_key}")
-                for fp in attachments:
-                    try:
-                        jira_tool.execute({"action": "add_attachment", "data": {"issue_key": issue_key, "file_path": fp}})
-                    except Exception as e:
-                        logger.warning(f"⚠ Failed to attach file to JIRA for ticket {ticket_id}: {e}")
+                logger.info("📎 Adding %s attachment(s) to JIRA issue %s", len(attachments), issue_key)
+                jobs.extend(functools.partial(self._jira_attachment, jira_tool, ticket_id, issue_key, fp) for fp in attachments)
 
         # Create subtasks for remediation steps (or add as comments if subtasks fail)
-        if jira_tool and remediation_steps:
+        if remediation_steps:
             issue_key = ticket.get("jira_issue_key") or jira_tool.issue_key
             if issue_key:
-                logger.info(f"📋 Tracking {len(remediation_steps)} remediation action(s) in JIRA issue {issue_key}")
-                
-                # Build detailed remediation comment
-                remediation_comment = "**Remediation Actions Executed:**\n\n"
-                for idx, step in enumerate(remediation_steps, 1):
-                    step_summary = step.get("summary", "Remediation step")
-                    step_desc = step.get("description", step_summary)
-                    remediation_comment += f"{idx}. {step_summary}\n"
-                    if step_desc != step_summary:
-                        remediation_comment += f"   Details: {step_desc}\n"
-                remediation_comment += "\n✓ All remediation actions completed successfully."
-                
-                # Add as comment (more reliable than subtasks)
-                try:
-                    jira_tool.execute({
-                        "action": "add_comment",
-                        "data": {
-                            "issue_key": issue_key,
-                            "comment": remediation_comment
-                        }
-                    })
-                    logger.info(f"✓ Remediation actions added as comment to {issue_key}")
-                except Exception as e:
-                    logger.warning(f"⚠ Failed to add remediation comment in JIRA for ticket {ticket_id}: {e}")
-                
-                # Try to create subtasks if possible (optional enhancement)
-                for step in remediation_steps:
+                jobs.append(functools.partial(self._jira_remediation, jira_tool, ticket_id, issue_key, remediation_steps))
+
+        # The jobs share one JIRATool, so its client is resolved here rather
+        # than by whichever job happens to run first
+        if len(jobs) > 1:
+            jira_tool._get_jira_client()
+        self._run_jira_jobs(jobs)
+
+    def _run_jira_jobs(self, jobs: List[Callable[[], None]]) -> None:
+        """Run independent JIRA writes side by side and wait for all of them"""
+        if len(jobs) == 1:
+            jobs[0]()
+            return
+        futures = [self._executor.submit(job) for job in jobs]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("⚠ JIRA update step failed: %s", e)
+
+    def _jira_transition(self, jira_tool: JIRATool, ticket_id: str, issue_key: str, status: str, target_transition: str) -> None:
+        """Transition the JIRA issue, then comment on the status change"""
+        logger.info("📋 Updating JIRA issue %s: incident status changed to '%s' → transition to '%s'", issue_key, status, target_transition)
+        try:
+            trans_result = jira_tool.execute({
+                "action": "transition_issue", 
+                "data": {"issue_key": issue_key, "transition": target_transition}
+            })
+            if trans_result.get("status") == "success":
+                logger.info("✓ JIRA transition successful for %s", issue_key)
+            else:
+                logger.warning("⚠ JIRA transition failed: %s", trans_result.get('message', 'Unknown error'))
+            
+            # add a comment about the transition
+            jira_tool.execute({
+                "action": "add_comment", 
+                "data": {"issue_key": issue_key, "comment": f"Incident status changed to: {status}"}
+            })
+        except Exception as e:
+            logger.warning("⚠ Failed to update JIRA issue for ticket %s: %s", ticket_id, e)
+
+    def _jira_notes(self, jira_tool: JIRATool, ticket_id: str, issue_key: str, note_list: List[str]) -> None:
+        """Add each note to the JIRA issue as a comment"""
+        logger.info("📝 Adding %s note(s) to JIRA issue %s", len(note_list), issue_key)
+        for n in note_list:
+            try:
+                jira_tool.execute({"action": "add_comment", "data": {"issue_key": issue_key, "comment": n}})
+            except Exception as e:
+                logger.warning("⚠ Failed to add comment to JIRA for ticket %s: %s", ticket_id, e)
+
+    def _jira_attachment(self, jira_tool: JIRATool, ticket_id: str, issue_key: str, fp: str) -> None:
+        """Attach one file to the JIRA issue"""
+        try:
+            jira_tool.execute({"action": "add_attachment", "data": {"issue_key": issue_key, "file_path": fp}})
+        except Exception as e:
+            logger.warning("⚠ Failed to attach file to JIRA for ticket %s: %s", ticket_id, e)
+
+    def _jira_remediation(self, jira_tool: JIRATool, ticket_id: str, issue_key: str, remediation_steps: List[Dict[str, Any]]) -> None:
+        """Record remediation steps on the JIRA issue"""
+        logger.info("📋 Tracking %s remediation action(s) in JIRA issue %s", len(remediation_steps), issue_key)
+
+        # Build detailed remediation comment
+        parts = ["**Remediation Actions Executed:**\n\n"]
+        for idx, step in enumerate(remediation_steps, 1):
+            step_summary = step.get("summary", "Remediation step")
+            step_desc = step.get("description", step_summary)
+            parts.append(f"{idx}. {step_summary}\n")
+            if step_desc != step_summary:
+                parts.append(f"   Details: {step_desc}\n")
+        parts.append("\n✓ All remediation actions completed successfully.")
+        remediation_comment = "".join(parts)
+
+        # Add as comment (more reliable than subtasks)
+        try:
+            jira_tool.execute({
+                "action": "add_comment",
+                "data": {
+                    "issue_key": issue_key,
+                    "comment": remediation_comment
+                }
+            })
+            logger.info("✓ Remediation actions added as comment to %s", issue_key)
+        except Exception as e:
+            logger.warning("⚠ Failed to add remediation comment in JIRA for ticket %s: %s", ticket_id, e)
+
+        # The comment above is the authoritative record of the steps;
+        # subtasks are only created when the config asks for them
+        if self.jira_config.get("create_subtasks"):
+            # One bulk request, and step by step only if that fails
+            step_summaries = [step.get("summary", "Remediation step") for step in remediation_steps]
+            bulk_result = jira_tool.execute({
+                "action": "bulk_create_subtasks",
+                "data": {
+                    "parent_key": issue_key,
+                    "summaries": step_summaries
+                }
+            })
+            if bulk_result.get("status") != "success":
+                logger.debug("Bulk subtask creation failed for %s: %s", issue_key, bulk_result.get('message'))
+                # Only retry the steps the bulk request did not create
+                retry_summaries = bulk_result.get("data", {}).get("failed_summaries", step_summaries)
+                for step_summary in retry_summaries:
                     try:
-                        step_summary = step.get("summary", "Remediation step")
                         jira_tool.execute({
                             "action": "create_subtask", 
                             "data": {
@@ -407,13 +689,11 @@ class TicketingSystemTool(MCPTool):
                         })
                     except Exception as e:
                         # Silently continue if subtask creation fails - comment already added
-                        logger.debug(f"Subtask creation not supported for {issue_key}, using comments instead")
+                        logger.debug("Subtask creation not supported for %s, using comments instead", issue_key)
                         break
 
-        logger.info(f"✓ Ticket updated: {ticket_id}")
-        return {"status": "success", "data": {"ticket_id": ticket_id, "ticket": ticket}}
-
     def _get_ticket(self, ticket_id: str) -> Dict[str, Any]:
-        if ticket_id not in self.tickets:
+        ticket = self.tickets.get(ticket_id)
+        if ticket is None:
             return {"status": "error", "message": f"Ticket not found: {ticket_id}"}
-        return {"status": "success", "data": {"ticket_id": ticket_id, "ticket": self.tickets[ticket_id]}}
\ No newline at end of file
+        return {"status": "success", "data": {"ticket_id": ticket_id, "ticket": ticket}}
\ No newline at end of file
@@ -3,13 +3,11 @@
 Verify JIRA integration by checking the last created incident.
 """
 import json
-from it_incident_response.models.incident import get_all_incidents
+from it_incident_response.models.incident import get_latest_incident
 
-incidents = get_all_incidents()
-if incidents:
-    # Get the most recently created incident
-    latest = max(incidents, key=lambda x: x.created_at)
-    incident_dict = latest.to_dict()
+# Get the most recently created incident
+incident_dict = get_latest_incident()
+if incident_dict:
     
     print("\n" + "="*80)
     print("JIRA INTEGRATION VERIFICATION")
@@ -19,11 +17,12 @@ if incidents:
     print(f"Title: {incident_dict.get('title')}")
     print(f"Status: {incident_dict.get('status')}")
     print(f"\nJIRA Integration Details:")
-    print(f"  - JIRA Issue Key: {incident_dict.get('metadata', {}).get('jira_issue_key', 'N/A')}")
-    print(f"  - JIRA Issue URL: {incident_dict.get('metadata', {}).get('jira_issue_url', 'N/A')}")
+    print(f"  - JIRA Issue Key: {incident_dict.get('jira_issue_key', 'N/A')}")
+    print(f"  - JIRA Issue URL: {incident_dict.get('jira_issue_url', 'N/A')}")
     
-    print(f"\nFull Incident JSON (metadata section):")
-    print(json.dumps(incident_dict.get('metadata', {}), indent=2))
+    # Metadata fields are merged into the incident's dictionary
+    print(f"\nFull Incident JSON (JIRA metadata):")
+    print(json.dumps({key: value for key, value in incident_dict.items() if key.startswith('jira_')}, indent=2))
     
     print("\n" + "="*80)
 else: